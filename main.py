@@ -1,13 +1,20 @@
 import argparse
 import logging
+from typing import TYPE_CHECKING
 
-from src.edinet.client import EdinetClient
 from src.utils import setup_logging
 
-setup_logging()
+if TYPE_CHECKING:
+    from src.models import FilingMetadata
+
 logger = logging.getLogger(__name__)
 
 
+def parse_filing_types(value: str) -> frozenset[str]:
+    """Parse a comma-separated list of filing type codes into a set."""
+    return frozenset(code.strip() for code in value.split(",") if code.strip())
+
+
 def parse_args() -> argparse.Namespace:
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(
@@ -26,19 +33,47 @@ def parse_args() -> argparse.Namespace:
         default=7,
         help="Number of days to look back for recent filings",
     )
+    parser.add_argument(
+        "--filing-types",
+        type=parse_filing_types,
+        help='Comma-separated filing type codes to include (e.g., "160,180")',
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        help="Write the matching filings to this file as JSON Lines",
+    )
 
     return parser.parse_args()
 
 
+def write_filings_jsonl(filings: list["FilingMetadata"], output_path: str) -> None:
+    """Write filings to a JSON Lines file one record at a time."""
+    with open(output_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+        for filing in filings:
+            f.write(filing.model_dump_json())
+            f.write("\n")
+    logger.info("Wrote %s filings to %s", len(filings), output_path)
+
+
 if __name__ == "__main__":
+    setup_logging()
     args = parse_args()
 
-    edinet_client = EdinetClient()
+    # Imported after argument parsing so `--help` skips loading the HTTP and
+    # pandas stack
+    from src.edinet.client import EdinetClient
 
-    all_filings = edinet_client.list_recent_filings(
-        lookback_days=args.lookback_days,
-        filer_names=[args.company_name],
-    )
+    with EdinetClient() as edinet_client:
+        all_filings = edinet_client.list_recent_filings(
+            lookback_days=args.lookback_days,
+            filing_type_codes=args.filing_types,
+            filer_names=[args.company_name] if args.company_name else None,
+        )
 
-    print("Here are the target filings:")
-    print(all_filings)
+    if args.output:
+        write_filings_jsonl(all_filings, args.output)
+    else:
+        print("Here are the target filings:")
+        for filing in all_filings:
+            print(filing)
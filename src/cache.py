@@ -7,12 +7,25 @@ and document downloads to reduce redundant requests to the EDINET API.
 
 import hashlib
 import json
+import logging
+import os
+import tempfile
+import threading
 import time
+from collections import OrderedDict
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any, TypeVar
 
+from src.utils import dumps_json, loads_json
+
 T = TypeVar("T")
 
+# Subdirectory holding binary payloads stored once by content hash
+CONTENT_DIR_NAME = "_content"
+
+logger = logging.getLogger(__name__)
+
 
 class CacheManager:
     """
@@ -21,23 +34,45 @@ class CacheManager:
     Provides caching for both JSON-serializable data and binary content.
     """
 
-    def __init__(self, cache_dir: str = ".cache", default_ttl: int = 3600):
+    def __init__(
+        self,
+        cache_dir: str = ".cache",
+        default_ttl: int = 3600,
+        memory_cache_size: int = 256,
+    ):
         """
         Initialize the cache manager.
 
         Args:
             cache_dir: Directory to store cache files.
             default_ttl: Default time-to-live in seconds (default: 1 hour).
+            memory_cache_size: Maximum number of parsed JSON entries kept in memory.
         """
         self.cache_dir = Path(cache_dir)
         self.default_ttl = default_ttl
 
+        # In-process LRU of parsed JSON entries, keyed by (cache key, parse
+        # function) and validated against the file's mtime so on-disk updates
+        # are picked up
+        self._memory_cache: OrderedDict[
+            tuple[str, Callable[[Any], Any] | None], tuple[float, Any]
+        ] = OrderedDict()
+        self._memory_cache_size = memory_cache_size
+        self._memory_lock = threading.Lock()
+
         # Create cache directory if it doesn't exist
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
+        # Plain-string prefix for building cache paths without Path allocations
+        self._cache_dir_prefix = str(self.cache_dir) + os.sep
+
+        # Content-addressed store for binary payloads; cache entries hard-link here
+        self._content_dir = os.path.join(self.cache_dir, CONTENT_DIR_NAME)
+        os.makedirs(self._content_dir, exist_ok=True)
+
     def _get_cache_key(self, key: str) -> str:
         """
-        Generate a filesystem-safe cache key using SHA256 hash.
+        Generate a filesystem-safe cache key using a 128-bit BLAKE2b hash.
 
         Args:
             key: Original cache key.
@@ -45,9 +80,9 @@ class CacheManager:
         Returns:
             Hashed cache key safe for filesystem use.
         """
-        return hashlib.sha256(key.encode()).hexdigest()
+        return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
 
-    def _get_cache_path(self, key: str, is_binary: bool = False) -> Path:
+    def _get_cache_path(self, key: str, is_binary: bool = False) -> str:
         """
         Get the full path for a cache file.
 
@@ -58,51 +93,192 @@ class CacheManager:
         Returns:
             Path to the cache file.
         """
-        cache_key = self._get_cache_key(key)
         extension = ".bin" if is_binary else ".json"
-        return self.cache_dir / f"{cache_key}{extension}"
+        return self._cache_dir_prefix + self._get_cache_key(key) + extension
 
-    def _is_expired(self, filepath: Path, ttl: int) -> bool:
+    def _get_fresh_mtime(self, filepath: str, ttl: int) -> float | None:
         """
-        Check if a cache file has expired.
+        Return the modification time of a cache file if it has not expired.
+
+        Uses a single stat call; a missing file is treated as expired.
 
         Args:
             filepath: Path to the cache file.
             ttl: Time-to-live in seconds.
 
         Returns:
-            True if the file has expired or doesn't exist.
+            The file's mtime, or None if the file has expired or doesn't exist.
         """
-        if not filepath.exists():
-            return True
+        try:
+            mtime = os.stat(filepath).st_mtime
+        except OSError:
+            return None
 
-        file_age = time.time() - filepath.stat().st_mtime
-        return file_age > ttl
+        if time.time() - mtime > ttl:
+            return None
+        return mtime
 
-    def get_json(self, key: str, ttl: int | None = None) -> Any | None:
+    def _write_atomic(self, cache_path: str, data: bytes) -> None:
         """
-        Retrieve JSON-serializable data from cache.
+        Write data to a cache file atomically.
+
+        The data is written to a temporary file in the cache directory and then
+        moved into place, so concurrent readers never see a partial entry.
 
         Args:
-            key: Cache key.
-            ttl: Time-to-live in seconds. If None, uses default_ttl.
+            cache_path: Final path of the cache file.
+            data: Bytes to write.
+
+        Raises:
+            OSError: If writing or renaming fails.
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def _link_content(self, cache_path: str, data: bytes) -> bool:
+        """
+        Store binary data once by content hash and hard-link the cache entry to it.
+
+        Identical payloads cached again (under the same or a different key)
+        are not rewritten; the existing blob's mtime is refreshed instead.
+
+        Args:
+            cache_path: Path of the cache entry to create.
+            data: Binary data to cache.
 
         Returns:
-            Cached data if valid and not expired, None otherwise.
+            True if the entry now links to the content store, False if the
+            store or hard links are unavailable and the data must be written directly.
+        """
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        content_path = os.path.join(self._content_dir, digest + ".bin")
+        link_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+        try:
+            try:
+                # Refresh the TTL of an existing blob instead of rewriting it
+                os.utime(content_path)
+            except FileNotFoundError:
+                self._write_atomic(content_path, data)
+
+            # Already linked; rename() between two links to one file is a no-op
+            if os.path.exists(cache_path) and os.path.samefile(
+                cache_path, content_path
+            ):
+                return True
+
+            os.link(content_path, link_path)
+            os.replace(link_path, cache_path)
+            return True
+        except OSError:
+            try:
+                os.unlink(link_path)
+            except OSError:
+                pass
+            return False
+
+    def _remove_orphaned_content(self) -> None:
+        """Remove content-store blobs that no cache entry links to anymore."""
+        try:
+            with os.scandir(self._content_dir) as entries:
+                for entry in entries:
+                    try:
+                        # DirEntry.stat() reports st_nlink as 0 on Windows
+                        if os.stat(entry.path).st_nlink <= 1:
+                            os.unlink(entry.path)
+                    except OSError:
+                        continue
+        except OSError:
+            return
+
+    def _get_json_memoized(
+        self,
+        key: str,
+        ttl: int | None,
+        parse: Callable[[Any], Any] | None,
+    ) -> Any | None:
+        """
+        Read a JSON cache entry, optionally converted by `parse`, via the in-memory LRU.
+
+        Memo entries are keyed by (key, parse) and validated against the file's
+        mtime, so on-disk updates are picked up.
         """
         ttl = ttl if ttl is not None else self.default_ttl
         cache_path = self._get_cache_path(key, is_binary=False)
 
-        if self._is_expired(cache_path, ttl):
+        mtime = self._get_fresh_mtime(cache_path, ttl)
+        if mtime is None:
             return None
 
+        memo_key = (key, parse)
+        with self._memory_lock:
+            entry = self._memory_cache.get(memo_key)
+            if entry is not None and entry[0] == mtime:
+                self._memory_cache.move_to_end(memo_key)
+                return entry[1]
+
         try:
-            with open(cache_path, encoding="utf-8") as f:
-                return json.load(f)
+            with open(cache_path, "rb") as f:
+                data = loads_json(f.read())
         except (FileNotFoundError, json.JSONDecodeError, OSError):
             # If we can't read the cache file, treat it as a cache miss
             return None
 
+        if parse is not None:
+            data = parse(data)
+
+        with self._memory_lock:
+            self._memory_cache[memo_key] = (mtime, data)
+            self._memory_cache.move_to_end(memo_key)
+            while len(self._memory_cache) > self._memory_cache_size:
+                self._memory_cache.popitem(last=False)
+
+        return data
+
+    def get_json(self, key: str, ttl: int | None = None) -> Any | None:
+        """
+        Retrieve JSON-serializable data from cache.
+
+        Args:
+            key: Cache key.
+            ttl: Time-to-live in seconds. If None, uses default_ttl.
+
+        Returns:
+            Cached data if valid and not expired, None otherwise.
+            Repeated hits may return the same object, so callers should not mutate it.
+        """
+        return self._get_json_memoized(key, ttl, None)
+
+    def get_json_parsed(
+        self, key: str, parse: Callable[[Any], T], ttl: int | None = None
+    ) -> T | None:
+        """
+        Retrieve cached JSON data converted by `parse`, e.g. a model's model_validate.
+
+        The converted value is kept in the in-memory LRU, so repeated hits on an
+        unchanged file skip both JSON decoding and `parse`.
+
+        Args:
+            key: Cache key.
+            parse: Function converting the decoded JSON; should be a stable
+                module- or class-level callable, as it is part of the memo key.
+            ttl: Time-to-live in seconds. If None, uses default_ttl.
+
+        Returns:
+            Parsed data if valid and not expired, None otherwise.
+            Repeated hits may return the same object, so callers should not mutate it.
+        """
+        return self._get_json_memoized(key, ttl, parse)
+
     def set_json(self, key: str, data: Any) -> bool:
         """
         Store JSON-serializable data in cache.
@@ -116,13 +292,16 @@ class CacheManager:
         """
         cache_path = self._get_cache_path(key, is_binary=False)
 
+        with self._memory_lock:
+            for memo_key in [k for k in self._memory_cache if k[0] == key]:
+                del self._memory_cache[memo_key]
+
         try:
-            with open(cache_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            self._write_atomic(cache_path, dumps_json(data))
             return True
-        except (OSError, TypeError) as e:
+        except (OSError, TypeError, ValueError) as e:
             # Log error but don't fail the operation
-            print(f"Warning: Failed to cache data for key {key}: {e}")
+            logger.warning("Failed to cache data for key %s: %s", key, e)
             return False
 
     def get_binary(self, key: str, ttl: int | None = None) -> bytes | None:
@@ -139,7 +318,7 @@ class CacheManager:
         ttl = ttl if ttl is not None else self.default_ttl
         cache_path = self._get_cache_path(key, is_binary=True)
 
-        if self._is_expired(cache_path, ttl):
+        if self._get_fresh_mtime(cache_path, ttl) is None:
             return None
 
         try:
@@ -163,34 +342,44 @@ class CacheManager:
         cache_path = self._get_cache_path(key, is_binary=True)
 
         try:
-            with open(cache_path, "wb") as f:
-                f.write(data)
+            if not self._link_content(cache_path, data):
+                self._write_atomic(cache_path, data)
             return True
         except OSError as e:
             # Log error but don't fail the operation
-            print(f"Warning: Failed to cache binary data for key {key}: {e}")
+            logger.warning("Failed to cache binary data for key %s: %s", key, e)
             return False
 
-    def clear_expired(self) -> int:
+    def clear_expired(self, ttl: int | None = None) -> int:
         """
         Remove all expired cache files.
 
+        Args:
+            ttl: Age in seconds after which a file counts as expired. If None,
+                uses default_ttl. Entries read with several TTLs should pass
+                the longest, so nothing a reader still accepts is removed.
+
         Returns:
             Number of files removed.
         """
+        ttl = ttl if ttl is not None else self.default_ttl
         removed_count = 0
+        now = time.time()
 
-        for cache_file in self.cache_dir.glob("*"):
-            if cache_file.is_file():
-                # Use default TTL for cleanup
-                if self._is_expired(cache_file, self.default_ttl):
-                    try:
-                        cache_file.unlink()
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                try:
+                    # DirEntry caches the stat result
+                    if now - entry.stat(follow_symlinks=False).st_mtime > ttl:
+                        os.unlink(entry.path)
                         removed_count += 1
-                    except OSError:
-                        # Skip files we can't remove
-                        continue
+                except OSError:
+                    # Skip files we can't stat or remove
+                    continue
 
+        self._remove_orphaned_content()
         return removed_count
 
     def clear_all(self) -> int:
@@ -202,15 +391,20 @@ class CacheManager:
         """
         removed_count = 0
 
-        for cache_file in self.cache_dir.glob("*"):
-            if cache_file.is_file():
-                try:
-                    cache_file.unlink()
-                    removed_count += 1
-                except OSError:
-                    # Skip files we can't remove
-                    continue
+        with self._memory_lock:
+            self._memory_cache.clear()
 
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if entry.is_file(follow_symlinks=False):
+                    try:
+                        os.unlink(entry.path)
+                        removed_count += 1
+                    except OSError:
+                        # Skip files we can't remove
+                        continue
+
+        self._remove_orphaned_content()
         return removed_count
 
     def get_cache_stats(self) -> dict[str, Any]:
@@ -233,12 +427,14 @@ class CacheManager:
         binary_files = 0
         total_size = 0
 
-        for cache_file in self.cache_dir.glob("*"):
-            if cache_file.is_file():
-                total_size += cache_file.stat().st_size
-                if cache_file.suffix == ".json":
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                total_size += entry.stat(follow_symlinks=False).st_size
+                if entry.name.endswith(".json"):
                     json_files += 1
-                elif cache_file.suffix == ".bin":
+                elif entry.name.endswith(".bin"):
                     binary_files += 1
 
         return {
@@ -1,9 +1,11 @@
+import functools
 import logging
 import os
+from collections.abc import Callable, Mapping
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
-from dotenv import load_dotenv
-
-load_dotenv(".env", override=True)
+from dotenv import dotenv_values
 
 # EDINET API configuration
 
@@ -18,24 +20,88 @@ def validate_api_key() -> str:
     Raises:
         ValueError: If EDINET_API_KEY is not set.
     """
+    _load_dotenv()
     api_key = os.getenv("EDINET_API_KEY", "")
     if not api_key:
         raise ValueError("EDINET_API_KEY environment variable is required")
     return api_key
 
 
-# Processing configuration
-MAX_RETRIES: int = int(os.getenv("MAX_RETRIES", "3"))
-DELAY_SECONDS: int = int(os.getenv("DELAY_SECONDS", "5"))
-DAYS_BACK: int = int(os.getenv("DAYS_BACK", "7"))
-
-# Cache configuration
-CACHE_ENABLED: bool = os.getenv("CACHE_ENABLED", "true").lower() == "true"
-CACHE_DIR: str = os.getenv("CACHE_DIR", ".cache")
-CACHE_TTL_FILINGS: int = int(os.getenv("CACHE_TTL_FILINGS", "86400"))  # 24 hours
-CACHE_TTL_DOCUMENTS: int = int(os.getenv("CACHE_TTL_DOCUMENTS", "604800"))  # 7 days
+# Environment-derived settings are resolved lazily on first access (PEP 562),
+# so importing this module for constants does not load .env.
+if TYPE_CHECKING:
+    # Processing configuration
+    MAX_RETRIES: int
+    DELAY_SECONDS: int
+    DAYS_BACK: int
+    DOWNLOAD_CONCURRENCY: int
+
+    # Cache configuration
+    CACHE_ENABLED: bool
+    CACHE_DIR: str
+    CACHE_TTL_FILINGS: int
+    CACHE_TTL_SETTLED_FILINGS: int
+    CACHE_TTL_DOCUMENTS: int
+
+
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean environment value; only "true" (any case) is truthy."""
+    return value.lower() == "true"
+
+
+# (name, parser, default) for every environment-derived setting
+_ENV_SETTINGS_SPEC: tuple[tuple[str, Callable[[str], Any], str], ...] = (
+    # Processing configuration
+    ("MAX_RETRIES", int, "3"),
+    ("DELAY_SECONDS", int, "5"),
+    ("DAYS_BACK", int, "7"),
+    ("DOWNLOAD_CONCURRENCY", int, "10"),
+    # Cache configuration
+    ("CACHE_ENABLED", _parse_bool, "true"),
+    ("CACHE_DIR", str, ".cache"),
+    # TTLs default to 24 hours for filings, 1 year for filings of settled
+    # dates (see FILINGS_SETTLE_DAYS) and 7 days for documents
+    ("CACHE_TTL_FILINGS", int, "86400"),
+    ("CACHE_TTL_SETTLED_FILINGS", int, "31536000"),
+    ("CACHE_TTL_DOCUMENTS", int, "604800"),
+)
+
+_ENV_SETTING_NAMES = frozenset(name for name, _, _ in _ENV_SETTINGS_SPEC)
+
+
+@functools.cache
+def _load_dotenv() -> None:
+    """Parse .env once per process and apply it over the current environment."""
+    os.environ.update(
+        {
+            key: value
+            for key, value in dotenv_values(".env").items()
+            if value is not None
+        }
+    )
+
+
+@functools.cache
+def _load_env_settings() -> dict[str, Any]:
+    """Read environment-derived settings once per process."""
+    _load_dotenv()
+
+    environ = os.environ
+    settings = {
+        name: parse(environ.get(name, default))
+        for name, parse, default in _ENV_SETTINGS_SPEC
+    }
+
+    logging.info("Configuration loaded successfully")
+    return settings
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve environment-derived settings on first access."""
+    if name in _ENV_SETTING_NAMES:
+        return _load_env_settings()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-logging.info("Configuration loaded successfully")
 
 # API Configuration
 EDINET_API_BASE_URL = "https://disclosure.edinet-fsa.go.jp/api/v2"
@@ -49,6 +115,26 @@ API_CSV_DOCUMENT_TYPE = "5"
 # Retry Configuration
 DEFAULT_MAX_RETRIES = 3
 DEFAULT_DELAY_SECONDS = 5
+MAX_RETRY_DELAY_SECONDS = 60
+# Too Many Requests / Service Unavailable responses may carry Retry-After
+RETRY_AFTER_STATUS_CODES = frozenset({429, 503})
+# Client errors that a retry cannot fix: bad request, invalid key, no access,
+# unknown document ID
+NON_RETRYABLE_STATUS_CODES = frozenset({400, 401, 403, 404})
+
+# Filing lists for dates at least this many days old rarely change, so they
+# are cached with CACHE_TTL_SETTLED_FILINGS instead of CACHE_TTL_FILINGS
+FILINGS_SETTLE_DAYS = 7
+
+# Download Concurrency
+MAX_DOWNLOAD_CONCURRENCY = 32
+# Async batches halve their concurrency on 429/503 at most once per this
+# many seconds, then grow it back by one slot per window of successes
+ADAPTIVE_CONCURRENCY_COOLDOWN_SECONDS = 1.0
+
+# Idle pooled connections are kept this long (httpx defaults to 5s), so they
+# survive retry backoff and parsing between requests instead of reconnecting
+HTTP_KEEPALIVE_EXPIRY_SECONDS = 30.0
 
 # HTTP Status Codes
 HTTP_SUCCESS = 200
@@ -61,6 +147,13 @@ ZIP_EXTENSION = ".zip"
 CSV_EXTENSION = ".csv"
 MACOS_METADATA_DIR = "__MACOSX"
 AUDITOR_REPORT_PREFIX = "jpaud"
+DOWNLOAD_CHUNK_SIZE = 1 << 18  # 256 KiB
+# Below this many ZIPs, zip_directory_to_filings parses in-process rather
+# than paying to start a worker pool
+MIN_ZIP_FILES_FOR_PROCESS_POOL = 2
+# Filer names are truncated in download filenames; 64 Japanese characters
+# (3 bytes each in UTF-8) stay well inside the common 255-byte name limit
+MAX_FILENAME_FILER_CHARS = 64
 
 # Document Processing Limits
 DEFAULT_ANALYSIS_LIMIT = 5
@@ -83,17 +176,19 @@ MAX_COMPANY_DESCRIPTION_WORDS = 15
 MAX_IMPACT_RATIONALE_WORDS = 25
 
 # Common XBRL Element IDs
-XBRL_ELEMENT_IDS = {
-    "EDINET_CODE": "jpdei_cor:EDINETCodeDEI",
-    "COMPANY_NAME_JA": "jpdei_cor:FilerNameInJapaneseDEI",
-    "COMPANY_NAME_EN": "jpdei_cor:FilerNameInEnglishDEI",
-    "DOCUMENT_TYPE": "jpdei_cor:DocumentTypeDEI",
-    "DOCUMENT_TITLE_COVER": "jpcrp-esr_cor:DocumentTitleCoverPage",
-    "DOCUMENT_TITLE": "jpcrp_cor:DocumentTitle",
-}
+XBRL_ELEMENT_IDS: Mapping[str, str] = MappingProxyType(
+    {
+        "EDINET_CODE": "jpdei_cor:EDINETCodeDEI",
+        "COMPANY_NAME_JA": "jpdei_cor:FilerNameInJapaneseDEI",
+        "COMPANY_NAME_EN": "jpdei_cor:FilerNameInEnglishDEI",
+        "DOCUMENT_TYPE": "jpdei_cor:DocumentTypeDEI",
+        "DOCUMENT_TITLE_COVER": "jpcrp-esr_cor:DocumentTitleCoverPage",
+        "DOCUMENT_TITLE": "jpcrp_cor:DocumentTitle",
+    }
+)
 
 # Extraordinary Report Specific Element IDs
-EXTRAORDINARY_REPORT_ELEMENT_IDS = [
+EXTRAORDINARY_REPORT_ELEMENT_IDS = (
     "jpcrp-esr_cor:ResolutionOfBoardOfDirectorsDescription",
     "jpcrp-esr_cor:SummaryOfReasonForSubmissionDescription",
     "jpcrp-esr_cor:ContentOfDecisionsDescription",
@@ -103,7 +198,7 @@ EXTRAORDINARY_REPORT_ELEMENT_IDS = [
     "jpcrp-esr_cor:DetailsOfTransactionPartiesDescription",
     "jpcrp-esr_cor:RationaleForTransactionDescription",
     "jpcrp-esr_cor:ImpactOnBusinessResultsDescription",
-]
+)
 
 # Text cleaning patterns
 TEXT_REPLACEMENTS = {
@@ -118,11 +213,13 @@ DEFAULT_DOWNLOAD_DIR = "./downloads"
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
 # Supported Document Types
-SUPPORTED_DOC_TYPES: dict[str, str] = {
-    "160": "Semi-Annual Report",
-    "140": "Quarterly Report",
-    "180": "Extraordinary Report",
-    "350": "Large Holding Report",
-    "030": "Securities Registration Statement",
-    "120": "Securities Report",
-}
+SUPPORTED_DOC_TYPES: Mapping[str, str] = MappingProxyType(
+    {
+        "160": "Semi-Annual Report",
+        "140": "Quarterly Report",
+        "180": "Extraordinary Report",
+        "350": "Large Holding Report",
+        "030": "Securities Registration Statement",
+        "120": "Securities Report",
+    }
+)
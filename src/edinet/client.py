@@ -1,28 +1,50 @@
+import asyncio
 import datetime
+import email.utils
+import functools
+import importlib.util
+import json
 import logging
 import os
+import random
+import re
 import time
+from collections.abc import AsyncIterator, Collection, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+from types import TracebackType
 from typing import Any
 
 import httpx
 
 from src.cache import CacheManager
 from src.config import (
+    ADAPTIVE_CONCURRENCY_COOLDOWN_SECONDS,
     API_CSV_DOCUMENT_TYPE,
     API_TYPE_METADATA_AND_RESULTS,
     CACHE_DIR,
     CACHE_ENABLED,
     CACHE_TTL_DOCUMENTS,
     CACHE_TTL_FILINGS,
+    CACHE_TTL_SETTLED_FILINGS,
     DEFAULT_DOWNLOAD_DIR,
     DELAY_SECONDS,
+    DOWNLOAD_CHUNK_SIZE,
+    DOWNLOAD_CONCURRENCY,
     EDINET_API_BASE_URL,
     EDINET_DOCUMENT_API_BASE_URL,
+    FILINGS_SETTLE_DAYS,
     HTTP_CLIENT_ERROR_START,
+    HTTP_KEEPALIVE_EXPIRY_SECONDS,
     HTTP_SERVER_ERROR_END,
     HTTP_SUCCESS,
+    MAX_DOWNLOAD_CONCURRENCY,
+    MAX_FILENAME_FILER_CHARS,
     MAX_RETRIES,
+    MAX_RETRY_DELAY_SECONDS,
+    NON_RETRYABLE_STATUS_CODES,
+    RETRY_AFTER_STATUS_CODES,
+    ZIP_EXTENSION,
     validate_api_key,
 )
 from src.edinet.decorators import handle_api_errors
@@ -38,11 +60,26 @@ from src.models import (
     FilingMetadata,
     ValidationError,
 )
-from src.processors.base_processor import BaseProcessor
+from src.utils import loads_json
 
 # Use module-specific logger
 logger = logging.getLogger(__name__)
 
+# Endpoint URLs; the list and document APIs live on different hosts, so they
+# are built once here rather than via a single client base_url
+_FILINGS_URL = f"{EDINET_API_BASE_URL}/documents.json"
+_DOCUMENT_URL_PREFIX = f"{EDINET_DOCUMENT_API_BASE_URL}/documents/"
+
+# Same shapes strptime("%Y-%m-%d") accepted, without its per-call parsing overhead
+_DATE_PATTERN = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})", re.ASCII)
+
+# Failures worth retrying: network and protocol errors, HTTP error statuses
+# and malformed JSON bodies. Anything else propagates on the first attempt.
+_RETRYABLE_ERRORS = (httpx.HTTPError, json.JSONDecodeError)
+
+# Path separators, control characters and characters Windows rejects in names
+_UNSAFE_FILENAME_CHARS = re.compile(r'[\x00-\x1f\x7f<>:"/\\|?*]+')
+
 
 class EdinetClient:
     """
@@ -51,9 +88,17 @@ class EdinetClient:
     Core Methods:
     - list_recent_filings(): Get recent filings metadata for the last N days.
     - list_filings(): Search and filter document metadata for date/date range
+    - alist_filings(): Same as list_filings(), fetching all dates concurrently
+    - iter_filing_metadata(): Same as list_filings(), yielding lazily date by date
     - get_filing(): Download a single document by ID
+    - stream_zip_to_file(): Download a single document straight to a file
     - download_filings(): Download multiple documents to local storage
+    - adownload_filings(): Download multiple documents concurrently
+    - aget_filings(): Download and parse multiple documents concurrently
+    - iter_filings(): Download and parse documents one by one, overlapping the two
+    - aiter_filings(): Like aget_filings(), yielding each document as it completes
     - save_bytes(): Save bytes data to a file with error handling
+    - close(): Release pooled HTTP connections (also called on `with` exit)
 
     """
 
@@ -66,6 +111,7 @@ class EdinetClient:
         timeout: int = 30,
         enable_cache: bool = CACHE_ENABLED,
         cache_dir: str = CACHE_DIR,
+        enable_http2: bool = True,
     ):
         """
         Initialize the EDINET client.
@@ -73,11 +119,14 @@ class EdinetClient:
         Args:
             api_key: EDINET API key. If None, validates and uses EDINET_API_KEY environment variable.
             max_retries: Maximum number of retry attempts for failed requests.
-            delay_seconds: Delay between retry attempts in seconds.
+            delay_seconds: Base delay for exponential retry backoff in seconds.
             download_dir: Default directory for downloading documents.
             timeout: Request timeout in seconds.
             enable_cache: Whether to enable response caching.
             cache_dir: Directory for cache files.
+            enable_http2: Whether to use HTTP/2 when the optional `h2` package
+                is installed, multiplexing requests over one connection.
+                Falls back to HTTP/1.1 otherwise.
         """
         self.api_key = api_key or validate_api_key()
 
@@ -99,22 +148,55 @@ class EdinetClient:
         # Initialize cache manager if caching is enabled
         self.cache_manager = CacheManager(cache_dir) if enable_cache else None
 
+        # httpx needs the optional h2 package for HTTP/2
+        self.http2 = enable_http2 and importlib.util.find_spec("h2") is not None
+
+        # EDINET takes the API key as a query parameter; clients add it to
+        # every request so call sites only pass request-specific params
+        self._base_params = {"Subscription-Key": self.api_key}
+
+        # time.monotonic() deadline set by a Retry-After header; every request
+        # on this client waits it out, so concurrent tasks back off together
+        self._rate_limited_until = 0.0
+
+        # Shared HTTP client so sequential requests reuse pooled connections
+        # instead of paying a new TCP and TLS handshake per call
+        self._client = httpx.Client(
+            timeout=timeout,
+            limits=httpx.Limits(keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_SECONDS),
+            params=self._base_params,
+            http2=self.http2,
+        )
+
         # Ensure download directory exists
         os.makedirs(self.download_dir, exist_ok=True)
 
         cache_status = "enabled" if enable_cache else "disabled"
         self.logger.info(
-            f"EdinetClient initialized with download directory: {self.download_dir}, cache: {cache_status}"
+            "EdinetClient initialized with download directory: %s, cache: %s",
+            self.download_dir,
+            cache_status,
         )
 
+    def __enter__(self) -> "EdinetClient":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
     # PUBLIC METHODS
     @handle_api_errors
     def list_recent_filings(
         self,
         lookback_days: int = 7,
         edinet_codes: list[str] | None = None,
-        filing_type_codes: list[str] | None = None,
-        excluded_filing_type_codes: list[str] | None = None,
+        filing_type_codes: Collection[str] | None = None,
+        excluded_filing_type_codes: Collection[str] | None = None,
         require_sec_code: bool = False,
         filer_names: list[str] | None = None,
     ) -> list[FilingMetadata]:
@@ -155,14 +237,18 @@ class EdinetClient:
         start_date: datetime.date,
         end_date: datetime.date | None = None,
         edinet_codes: list[str] | None = None,
-        filing_type_codes: list[str] | None = None,
-        excluded_filing_type_codes: list[str] | None = None,
+        filing_type_codes: Collection[str] | None = None,
+        excluded_filing_type_codes: Collection[str] | None = None,
         require_sec_code: bool = False,
         filer_names: list[str] | None = None,
     ) -> list[FilingMetadata]:
         """
         Search and filter document metadata for a single date or date range.
 
+        Multi-day ranges are fetched concurrently via alist_filings(), except
+        when called from inside a running event loop (e.g. a Jupyter notebook),
+        where dates are fetched one at a time.
+
         Args:
             start_date: Start date (or single date if end_date is None).
             end_date: End date for range queries. If None, queries single date.
@@ -183,78 +269,170 @@ class EdinetClient:
         if start_date > end_date:
             raise ValueError("start_date must be <= end_date")
 
+        if end_date > start_date:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                return asyncio.run(
+                    self.alist_filings(
+                        start_date=start_date,
+                        end_date=end_date,
+                        edinet_codes=edinet_codes,
+                        filing_type_codes=filing_type_codes,
+                        excluded_filing_type_codes=excluded_filing_type_codes,
+                        require_sec_code=require_sec_code,
+                        filer_names=filer_names,
+                    )
+                )
+
+        matching_docs = list(
+            self.iter_filing_metadata(
+                start_date=start_date,
+                end_date=end_date,
+                edinet_codes=edinet_codes,
+                filing_type_codes=filing_type_codes,
+                excluded_filing_type_codes=excluded_filing_type_codes,
+                require_sec_code=require_sec_code,
+                filer_names=filer_names,
+            )
+        )
+
+        self.logger.info("Retrieved %s total matching documents", len(matching_docs))
+        return matching_docs
+
+    def iter_filing_metadata(
+        self,
+        start_date: datetime.date,
+        end_date: datetime.date | None = None,
+        edinet_codes: list[str] | None = None,
+        filing_type_codes: Collection[str] | None = None,
+        excluded_filing_type_codes: Collection[str] | None = None,
+        require_sec_code: bool = False,
+        filer_names: list[str] | None = None,
+    ) -> Iterator[FilingMetadata]:
+        """
+        Lazily yield matching document metadata, one date at a time.
+
+        Takes the same filters as list_filings(). Dates are fetched in order
+        and only when the caller asks for more, so processing (e.g. downloading)
+        can start on early dates while later ones are still to be fetched,
+        and stopping early skips the remaining requests.
+
+        Yields:
+            Document metadata that match the criteria, in date order.
+
+        Raises:
+            ValueError: If start_date is after end_date (on first iteration).
+            EdinetAuthenticationError: If the API rejects the request.
+        """
+        if end_date is None:
+            end_date = start_date
+
+        if start_date > end_date:
+            raise ValueError("start_date must be <= end_date")
+
         # Normalize filter parameters - convert empty lists to None for proper filtering
         edinet_codes = edinet_codes or None
         filing_type_codes = filing_type_codes or None
-        excluded_filing_type_codes = excluded_filing_type_codes or None
-
-        matching_docs = []
-        current_date = start_date
+        # Hash set so the per-document exclusion check is O(1)
+        excluded_filing_type_codes = (
+            frozenset(excluded_filing_type_codes)
+            if excluded_filing_type_codes
+            else None
+        )
 
-        while current_date <= end_date:
+        for current_date in _date_range(start_date, end_date):
             try:
                 docs_res = self._fetch_filings_for_date(current_date)
-                if isinstance(docs_res, EdinetErrorResponse):
-                    raise EdinetAuthenticationError(
-                        f"Error fetching documents for {current_date}: {docs_res}. Errors: {docs_res.message}"
-                    )
+                daily_docs = self._filter_daily_filings(
+                    current_date,
+                    docs_res,
+                    edinet_codes=edinet_codes,
+                    filing_type_codes=filing_type_codes,
+                    excluded_filing_type_codes=excluded_filing_type_codes,
+                    require_sec_code=require_sec_code,
+                    filer_names=filer_names,
+                )
+            except Exception as e:
+                # Re-raises authentication errors to stop execution
+                self._handle_daily_error(current_date, e)
+                continue
+            yield from daily_docs
 
-                if docs_res and docs_res.results:
-                    self.logger.info(
-                        f"Found {len(docs_res.results)} documents for {current_date}"
-                    )
+    async def alist_filings(
+        self,
+        start_date: datetime.date,
+        end_date: datetime.date | None = None,
+        edinet_codes: list[str] | None = None,
+        filing_type_codes: Collection[str] | None = None,
+        excluded_filing_type_codes: Collection[str] | None = None,
+        require_sec_code: bool = False,
+        filer_names: list[str] | None = None,
+        concurrency: int = DOWNLOAD_CONCURRENCY,
+    ) -> list[FilingMetadata]:
+        """
+        Async counterpart of list_filings() that fetches all dates concurrently.
 
-                    # Apply exclusion filter first (only logic not handled by filter_filings)
-                    docs_to_filter = docs_res.results
-                    if excluded_filing_type_codes:
-                        docs_to_filter = [
-                            doc
-                            for doc in docs_to_filter
-                            if doc.docTypeCode not in excluded_filing_type_codes
-                        ]
-
-                    # Handle require_sec_code since filter_filings doesn't support "require non-null"
-                    if require_sec_code:
-                        docs_to_filter = [
-                            doc for doc in docs_to_filter if doc.secCode is not None
-                        ]
-
-                    # Use filter_filings for all other filtering
-                    filtered_docs = filter_filings(
-                        docs_to_filter,
-                        edinet_codes=edinet_codes,
-                        doc_type_codes=filing_type_codes,
-                        filer_names=filer_names,
-                    )
+        Takes the same filters as list_filings(); at most `concurrency` daily
+        requests are in flight at once. Results are returned in date order.
 
-                    matching_docs.extend(filtered_docs)
-                    self.logger.info(
-                        f"Added {len(filtered_docs)} matching documents for {current_date}"
-                    )
-                else:
-                    self.logger.info(f"No documents found for {current_date}")
+        Args:
+            concurrency: Maximum number of simultaneous requests
+                (capped at MAX_DOWNLOAD_CONCURRENCY).
 
-            except EdinetAuthenticationError:
-                # Re-raise authentication errors immediately to stop execution
-                raise
-            except (
-                EdinetConnectionError,
-                EdinetRetryExceededError,
-                EdinetDocumentFetchError,
-            ) as e:
-                self.logger.error(
-                    f"API error processing documents for {current_date}: {e}"
-                )
-            except (ValueError, TypeError) as e:
-                self.logger.error(f"Data validation error for {current_date}: {e}")
+        Returns:
+            List of document metadata that match the criteria.
+        """
+        if end_date is None:
+            end_date = start_date
+
+        if start_date > end_date:
+            raise ValueError("start_date must be <= end_date")
+
+        edinet_codes = edinet_codes or None
+        filing_type_codes = filing_type_codes or None
+        # Hash set so the per-document exclusion check is O(1)
+        excluded_filing_type_codes = (
+            frozenset(excluded_filing_type_codes)
+            if excluded_filing_type_codes
+            else None
+        )
+
+        concurrency = self._validate_concurrency(concurrency)
+        limiter = _AdaptiveLimiter(concurrency)
+        dates = _date_range(start_date, end_date)
+
+        async def _fetch_and_filter(date: datetime.date) -> list[FilingMetadata]:
+            async with limiter:
+                docs_res = await self._afetch_filings_for_date(client, date)
+            # Filter each day as soon as it arrives, while later days are still
+            # in flight, so only the matching filings are kept until the end
+            return self._filter_daily_filings(
+                date,
+                docs_res,
+                edinet_codes=edinet_codes,
+                filing_type_codes=filing_type_codes,
+                excluded_filing_type_codes=excluded_filing_type_codes,
+                require_sec_code=require_sec_code,
+                filer_names=filer_names,
+            )
+
+        async with self._create_async_client(concurrency, limiter) as client:
+            results = await asyncio.gather(
+                *[_fetch_and_filter(date) for date in dates], return_exceptions=True
+            )
+
+        matching_docs = []
+        for current_date, result in zip(dates, results, strict=True):
+            try:
+                if isinstance(result, BaseException):
+                    raise result
+                matching_docs.extend(result)
             except Exception as e:
-                self.logger.error(
-                    f"Unexpected error processing documents for {current_date}: {e}"
-                )
-            finally:
-                current_date += datetime.timedelta(days=1)
+                # Re-raises authentication errors to stop execution
+                self._handle_daily_error(current_date, e)
 
-        self.logger.info(f"Retrieved {len(matching_docs)} total matching documents")
+        self.logger.info("Retrieved %s total matching documents", len(matching_docs))
         return matching_docs
 
     def filter_filings(
@@ -282,6 +460,9 @@ class EdinetClient:
         Raises:
             EdinetDocumentFetchError: If document download fails.
         """
+        # Deferred so listing filings does not import pandas and chardet
+        from src.processors.base_processor import BaseProcessor
+
         try:
             zip_bytes = self.get_zip_bytes(filing_metadata)
             filing = BaseProcessor.zip_bytes_to_filing(
@@ -305,14 +486,11 @@ class EdinetClient:
             cache_key = f"document:{doc_id}:{API_CSV_DOCUMENT_TYPE}"
             cached_bytes = self.cache_manager.get_binary(cache_key, CACHE_TTL_DOCUMENTS)
             if cached_bytes:
-                self.logger.info(f"Cache hit for document {doc_id}")
+                self.logger.info("Cache hit for document %s", doc_id)
                 return cached_bytes
 
-        url = f"{EDINET_DOCUMENT_API_BASE_URL}/documents/{doc_id}"
-        params = {
-            "type": API_CSV_DOCUMENT_TYPE,
-            "Subscription-Key": self.api_key,
-        }
+        url = _DOCUMENT_URL_PREFIX + doc_id
+        params = {"type": API_CSV_DOCUMENT_TYPE}
 
         zip_bytes = self._fetch_with_retry(
             url,
@@ -326,10 +504,32 @@ class EdinetClient:
         if self.cache_manager:
             cache_key = f"document:{doc_id}:{API_CSV_DOCUMENT_TYPE}"
             if self.cache_manager.set_binary(cache_key, zip_bytes):
-                self.logger.info(f"Cached document {doc_id}")
+                self.logger.info("Cached document %s", doc_id)
 
         return zip_bytes
 
+    @handle_api_errors
+    def stream_zip_to_file(
+        self, filing_metadata: FilingMetadata, filepath: str
+    ) -> None:
+        """
+        Download a single document by ID straight to a file.
+
+        The response body is written in chunks, so the ZIP is never held in
+        memory in full. The cache is bypassed.
+
+        Args:
+            filing_metadata: The metadata of the document to download.
+            filepath: Path where the ZIP file should be saved.
+
+        Raises:
+            EdinetConnectionError: If the download fails after all retries.
+        """
+        url = _DOCUMENT_URL_PREFIX + filing_metadata.docID
+        params = {"type": API_CSV_DOCUMENT_TYPE}
+
+        self._stream_with_retry(url, params, filepath)
+
     def download_filings(
         self,
         filing_metadatas: list[FilingMetadata],
@@ -338,51 +538,281 @@ class EdinetClient:
         """
         Download all filings in the provided list.
 
+        Downloads run concurrently via adownload_filings(). When called from
+        inside a running event loop (e.g. a Jupyter notebook), where
+        asyncio.run() is unavailable, they fall back to one at a time.
+
         Args:
             filing_metadatas: The metadata of the documents to download.
             download_dir: Directory to save documents. If None, uses instance default.
         """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(self.adownload_filings(filing_metadatas, download_dir))
+            return
+
         target_dir = download_dir or self.download_dir
         Path(target_dir).mkdir(parents=True, exist_ok=True)
+        # One directory scan instead of a stat() per filing
+        existing_doc_ids = _scan_downloaded_doc_ids(target_dir)
 
+        filing_metadatas = _unique_by_doc_id(filing_metadatas)
         total_docs = len(filing_metadatas)
-        self.logger.info(f"Downloading {total_docs} documents to {target_dir}")
+        self.logger.info("Downloading %s documents to %s", total_docs, target_dir)
 
         for i, filing_metadata in enumerate(filing_metadatas, 1):
-            doc_id = filing_metadata.docID
-            doc_type_code = filing_metadata.docTypeCode
-            filer = filing_metadata.filerName
+            if filing_metadata.docID in existing_doc_ids:
+                continue  # Skip if already downloaded
 
-            if not all([doc_id, doc_type_code, filer]):
+            filepath = self._get_download_path(filing_metadata, target_dir)
+            if filepath is None:
                 self.logger.warning(
-                    f"Skipping document {i}/{total_docs} - missing metadata"
+                    "Skipping document %s/%s - missing metadata", i, total_docs
                 )
                 continue
 
-            filename = f"{doc_id}-{doc_type_code}-{filer}.zip"
-            filepath = os.path.join(target_dir, filename)
-
-            if os.path.exists(filepath):
-                continue  # Skip if already downloaded
-
-            self.logger.info(f"Downloading {i}/{total_docs}: {filename}")
+            filename = os.path.basename(filepath)
+            self.logger.info("Downloading %s/%s: %s", i, total_docs, filename)
 
             try:
-                zip_bytes = self.get_zip_bytes(filing_metadata)
-                self.save_bytes(zip_bytes, filepath)
+                if self.cache_manager:
+                    zip_bytes = self.get_zip_bytes(filing_metadata)
+                    self.save_bytes(zip_bytes, filepath)
+                else:
+                    self.stream_zip_to_file(filing_metadata, filepath)
             except (
                 EdinetConnectionError,
                 EdinetRetryExceededError,
                 EdinetDocumentFetchError,
             ) as e:
-                self.logger.error(f"API error downloading {filename}: {e}")
+                self.logger.error("API error downloading %s: %s", filename, e)
             except OSError as e:
-                self.logger.error(f"File system error saving {filename}: {e}")
+                self.logger.error("File system error saving %s: %s", filename, e)
             except Exception as e:
-                self.logger.error(f"Unexpected error downloading {filename}: {e}")
+                self.logger.error("Unexpected error downloading %s: %s", filename, e)
+
+        self.logger.info("Download complete")
+
+    async def adownload_filings(
+        self,
+        filing_metadatas: list[FilingMetadata],
+        download_dir: str | None = None,
+        concurrency: int = DOWNLOAD_CONCURRENCY,
+    ) -> None:
+        """
+        Download all filings in the provided list concurrently.
+
+        Downloads are issued over a shared async HTTP client with at most
+        `concurrency` requests in flight at once.
+
+        Args:
+            filing_metadatas: The metadata of the documents to download.
+            download_dir: Directory to save documents. If None, uses instance default.
+            concurrency: Maximum number of simultaneous downloads
+                (capped at MAX_DOWNLOAD_CONCURRENCY).
+        """
+        concurrency = self._validate_concurrency(concurrency)
+
+        target_dir = download_dir or self.download_dir
+        Path(target_dir).mkdir(parents=True, exist_ok=True)
+        # One directory scan instead of a stat() per filing
+        existing_doc_ids = _scan_downloaded_doc_ids(target_dir)
+
+        # Duplicates would download twice and race on the same .part file
+        filing_metadatas = _unique_by_doc_id(filing_metadatas)
+        total_docs = len(filing_metadatas)
+        self.logger.info(
+            "Downloading %s documents to %s (concurrency: %s)",
+            total_docs,
+            target_dir,
+            concurrency,
+        )
+
+        limiter = _AdaptiveLimiter(concurrency)
+
+        async def _fetch(i: int, filing_metadata: FilingMetadata) -> None:
+            if filing_metadata.docID in existing_doc_ids:
+                return  # Skip if already downloaded
+
+            filepath = self._get_download_path(filing_metadata, target_dir)
+            if filepath is None:
+                self.logger.warning(
+                    "Skipping document %s/%s - missing metadata", i, total_docs
+                )
+                return
+
+            filename = os.path.basename(filepath)
+            async with limiter:
+                self.logger.info("Downloading %s/%s: %s", i, total_docs, filename)
+                try:
+                    if self.cache_manager:
+                        zip_bytes = await self._aget_zip_bytes(client, filing_metadata)
+                        await asyncio.to_thread(self.save_bytes, zip_bytes, filepath)
+                    else:
+                        await self._astream_zip_to_file(
+                            client, filing_metadata, filepath
+                        )
+                except (
+                    EdinetConnectionError,
+                    EdinetRetryExceededError,
+                    EdinetDocumentFetchError,
+                ) as e:
+                    self.logger.error("API error downloading %s: %s", filename, e)
+                except OSError as e:
+                    self.logger.error("File system error saving %s: %s", filename, e)
+                except Exception as e:
+                    self.logger.error(
+                        "Unexpected error downloading %s: %s", filename, e
+                    )
+
+        async with (
+            self._create_async_client(concurrency, limiter) as client,
+            asyncio.TaskGroup() as task_group,
+        ):
+            for i, filing_metadata in enumerate(filing_metadatas, 1):
+                task_group.create_task(_fetch(i, filing_metadata))
 
         self.logger.info("Download complete")
 
+    async def aget_filings(
+        self,
+        filing_metadatas: list[FilingMetadata],
+        concurrency: int = DOWNLOAD_CONCURRENCY,
+    ) -> dict[str, Filing | None]:
+        """
+        Download and parse multiple filings concurrently.
+
+        At most `concurrency` downloads are in flight at once; ZIP parsing runs
+        in worker threads so it overlaps with the remaining downloads.
+
+        Args:
+            filing_metadatas: The metadata of the documents to fetch.
+            concurrency: Maximum number of simultaneous downloads
+                (capped at MAX_DOWNLOAD_CONCURRENCY).
+
+        Returns:
+            Mapping of docID to its Filing, or None if it could not be fetched or parsed.
+        """
+        return {
+            doc_id: filing
+            async for doc_id, filing in self.aiter_filings(
+                filing_metadatas, concurrency
+            )
+        }
+
+    def iter_filings(
+        self, filing_metadatas: Iterable[FilingMetadata]
+    ) -> Iterator[tuple[str, Filing | None]]:
+        """
+        Download and parse filings one at a time, in input order.
+
+        Each ZIP is parsed in a worker thread while the next one downloads,
+        so network transfer and parsing overlap instead of alternating as
+        they do when calling get_filing() in a loop.
+
+        Args:
+            filing_metadatas: The metadata of the documents to fetch.
+
+        Yields:
+            (docID, Filing) pairs; the Filing is None if it could not be
+            fetched or parsed.
+        """
+        from src.processors.base_processor import BaseProcessor
+
+        seen_doc_ids: set[str] = set()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending: tuple[str, Future[Filing | None]] | None = None
+            for filing_metadata in filing_metadatas:
+                doc_id = filing_metadata.docID
+                if doc_id in seen_doc_ids:
+                    continue  # Already yielded; skip the duplicate download
+                seen_doc_ids.add(doc_id)
+                try:
+                    zip_bytes = self.get_zip_bytes(filing_metadata)
+                except (
+                    EdinetConnectionError,
+                    EdinetRetryExceededError,
+                    EdinetDocumentFetchError,
+                ) as e:
+                    self.logger.error("API error fetching %s: %s", doc_id, e)
+                    future: Future[Filing | None] = Future()
+                    future.set_result(None)
+                else:
+                    future = executor.submit(
+                        BaseProcessor.zip_bytes_to_filing,
+                        zip_bytes=zip_bytes,
+                        filing_metadata=filing_metadata,
+                    )
+
+                if pending is not None:
+                    yield pending[0], pending[1].result()
+                pending = doc_id, future
+
+            if pending is not None:
+                yield pending[0], pending[1].result()
+
+    async def aiter_filings(
+        self,
+        filing_metadatas: list[FilingMetadata],
+        concurrency: int = DOWNLOAD_CONCURRENCY,
+    ) -> AsyncIterator[tuple[str, Filing | None]]:
+        """
+        Download and parse filings concurrently, yielding each as it completes.
+
+        At most `concurrency` downloads are in flight at once; ZIP parsing runs
+        in worker threads so it overlaps with the remaining downloads. Results
+        arrive in completion order, not input order.
+
+        Args:
+            filing_metadatas: The metadata of the documents to fetch.
+            concurrency: Maximum number of simultaneous downloads
+                (capped at MAX_DOWNLOAD_CONCURRENCY).
+
+        Yields:
+            (docID, Filing) pairs; the Filing is None if it could not be
+            fetched or parsed.
+        """
+        from src.processors.base_processor import BaseProcessor
+
+        concurrency = self._validate_concurrency(concurrency)
+        limiter = _AdaptiveLimiter(concurrency)
+
+        async def _fetch(filing_metadata: FilingMetadata) -> tuple[str, Filing | None]:
+            doc_id = filing_metadata.docID
+            async with limiter:
+                try:
+                    zip_bytes = await self._aget_zip_bytes(client, filing_metadata)
+                except (
+                    EdinetConnectionError,
+                    EdinetRetryExceededError,
+                    EdinetDocumentFetchError,
+                ) as e:
+                    self.logger.error("API error fetching %s: %s", doc_id, e)
+                    return doc_id, None
+
+            filing = await asyncio.to_thread(
+                BaseProcessor.zip_bytes_to_filing,
+                zip_bytes=zip_bytes,
+                filing_metadata=filing_metadata,
+            )
+            return doc_id, filing
+
+        async with self._create_async_client(concurrency, limiter) as client:
+            tasks = [
+                asyncio.create_task(_fetch(filing_metadata))
+                for filing_metadata in _unique_by_doc_id(filing_metadatas)
+            ]
+            try:
+                for next_result in asyncio.as_completed(tasks):
+                    yield await next_result
+            finally:
+                # The caller may stop iterating early; stop the remaining
+                # downloads before the client is closed
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
     def clear_cache(self) -> dict[str, int | str]:
         """
         Clear all cached data.
@@ -394,21 +824,28 @@ class EdinetClient:
             return {"files_removed": 0, "message": "Caching is disabled"}
 
         files_removed = self.cache_manager.clear_all()
-        self.logger.info(f"Cleared {files_removed} cache files")
+        self.logger.info("Cleared %s cache files", files_removed)
         return {"files_removed": files_removed}
 
     def clear_expired_cache(self) -> dict[str, int | str]:
         """
         Clear only expired cache entries.
 
+        An entry is expired once it is older than the longest configured TTL
+        (normally CACHE_TTL_SETTLED_FILINGS).
+
         Returns:
             Dictionary with cache clearing statistics.
         """
         if not self.cache_manager:
             return {"files_removed": 0, "message": "Caching is disabled"}
 
-        files_removed = self.cache_manager.clear_expired()
-        self.logger.info(f"Cleared {files_removed} expired cache files")
+        # Settled filing lists are kept far longer than anything else, so
+        # only remove entries that have outlived the longest configured TTL
+        files_removed = self.cache_manager.clear_expired(
+            max(CACHE_TTL_FILINGS, CACHE_TTL_SETTLED_FILINGS, CACHE_TTL_DOCUMENTS)
+        )
+        self.logger.info("Cleared %s expired cache files", files_removed)
         return {"files_removed": files_removed}
 
     def get_cache_stats(self) -> dict[str, Any]:
@@ -423,6 +860,10 @@ class EdinetClient:
 
         return self.cache_manager.get_cache_stats()
 
+    def close(self) -> None:
+        """Close the underlying HTTP client and release pooled connections."""
+        self._client.close()
+
     def save_bytes(self, data: bytes, filepath: str) -> None:
         """
         Save bytes data to a file with error handling.
@@ -437,12 +878,12 @@ class EdinetClient:
         try:
             with open(filepath, "wb") as f:
                 f.write(data)
-            self.logger.info(f"Saved file: {filepath}")
+            self.logger.info("Saved file: %s", filepath)
         except OSError as e:
-            self.logger.error(f"File system error saving {filepath}: {e}")
+            self.logger.error("File system error saving %s: %s", filepath, e)
             raise
         except Exception as e:
-            self.logger.error(f"Unexpected error saving file {filepath}: {e}")
+            self.logger.error("Unexpected error saving file %s: %s", filepath, e)
             raise
 
     # PRIVATE METHODS
@@ -458,38 +899,313 @@ class EdinetClient:
         """
         date_str = self._validate_date(date)
 
-        # Check cache first if enabled
-        if self.cache_manager:
-            cache_key = f"filings:{date_str}:{api_type}"
-            cached_response = self.cache_manager.get_json(cache_key, CACHE_TTL_FILINGS)
-            if cached_response:
-                self.logger.info(f"Cache hit for filings on {date_str}")
-                # Return appropriate response type based on cached data
-                if "results" in cached_response:
-                    return EdinetSuccessResponse.model_validate(cached_response)
-                else:
-                    return EdinetErrorResponse.model_validate(cached_response)
+        cached_response = self._get_cached_filings(date_str, api_type)
+        if cached_response is not None:
+            return cached_response
 
-        url = f"{EDINET_API_BASE_URL}/documents.json"
+        url = _FILINGS_URL
         params = {
             "date": date_str,
             "type": str(api_type),
-            "Subscription-Key": self.api_key,
         }
 
         response = self._fetch_with_retry(url, params, return_content=False)
+        return self._parse_filings_response(date_str, api_type, response)
+
+    async def _afetch_filings_for_date(
+        self,
+        client: httpx.AsyncClient,
+        date: str | datetime.date,
+        api_type: int = int(API_TYPE_METADATA_AND_RESULTS),
+    ) -> EdinetSuccessResponse | EdinetErrorResponse:
+        """
+        Async counterpart of _fetch_filings_for_date() using a shared async HTTP client.
+        """
+        date_str = self._validate_date(date)
+
+        cached_response = await asyncio.to_thread(
+            self._get_cached_filings, date_str, api_type
+        )
+        if cached_response is not None:
+            return cached_response
+
+        url = _FILINGS_URL
+        params = {
+            "date": date_str,
+            "type": str(api_type),
+        }
+
+        response = await self._afetch_with_retry(
+            client, url, params, return_content=False
+        )
+        return await asyncio.to_thread(
+            self._parse_filings_response, date_str, api_type, response
+        )
+
+    def _get_cached_filings(
+        self,
+        date_str: str,
+        api_type: int,
+    ) -> EdinetSuccessResponse | EdinetErrorResponse | None:
+        """
+        Return the cached filings response for a date, or None on a cache miss.
+        """
+        if not self.cache_manager:
+            return None
+
+        # The validated response is memoized by the cache manager, so repeat
+        # hits on an unchanged entry skip model validation
+        cache_key = f"filings:{date_str}:{api_type}"
+        cached_response = self.cache_manager.get_json_parsed(
+            cache_key,
+            _validate_cached_filings,
+            self._get_filings_cache_ttl(date_str),
+        )
+        if cached_response is None:
+            return None
+
+        self.logger.info("Cache hit for filings on %s", date_str)
+        return cached_response
+
+    def _parse_filings_response(
+        self,
+        date_str: str,
+        api_type: int,
+        response: dict[str, Any],
+    ) -> EdinetSuccessResponse | EdinetErrorResponse:
+        """
+        Cache a raw filings response (if caching is enabled) and validate it.
+
+        Error responses are not cached, so a transient or authentication
+        failure is retried on the next call instead of being served from cache.
+        """
+        if "results" not in response.keys():
+            return EdinetErrorResponse.model_validate(response)
 
         # Cache the raw response if caching is enabled
         if self.cache_manager:
             cache_key = f"filings:{date_str}:{api_type}"
             if self.cache_manager.set_json(cache_key, response):
-                self.logger.info(f"Cached filings for {date_str}")
-
-        if "results" not in response.keys():
-            return EdinetErrorResponse.model_validate(response)
+                self.logger.info("Cached filings for %s", date_str)
 
         return EdinetSuccessResponse.model_validate(response)
 
+    def _get_filings_cache_ttl(self, date_str: str) -> int:
+        """
+        Return the cache TTL for a date's filing list.
+
+        Lists for dates at least FILINGS_SETTLE_DAYS old are treated as settled
+        and kept for CACHE_TTL_SETTLED_FILINGS; recent dates, whose lists may
+        still change, use CACHE_TTL_FILINGS.
+        """
+        settled_before = datetime.date.today() - datetime.timedelta(
+            days=FILINGS_SETTLE_DAYS
+        )
+        if datetime.date.fromisoformat(date_str) <= settled_before:
+            return CACHE_TTL_SETTLED_FILINGS
+        return CACHE_TTL_FILINGS
+
+    def _filter_daily_filings(
+        self,
+        current_date: datetime.date,
+        docs_res: EdinetSuccessResponse | EdinetErrorResponse,
+        edinet_codes: list[str] | None,
+        filing_type_codes: Collection[str] | None,
+        excluded_filing_type_codes: Collection[str] | None,
+        require_sec_code: bool,
+        filer_names: list[str] | None,
+    ) -> list[FilingMetadata]:
+        """
+        Apply the list_filings() filters to a single day's response.
+
+        Raises:
+            EdinetAuthenticationError: If the API returned an error response.
+        """
+        if isinstance(docs_res, EdinetErrorResponse):
+            raise EdinetAuthenticationError(
+                f"Error fetching documents for {current_date}: {docs_res}. Errors: {docs_res.message}"
+            )
+
+        if not (docs_res and docs_res.results):
+            self.logger.info("No documents found for %s", current_date)
+            return []
+
+        self.logger.info(
+            "Found %s documents for %s", len(docs_res.results), current_date
+        )
+
+        # Apply exclusion filter first (only logic not handled by filter_filings)
+        docs_to_filter = docs_res.results
+        if excluded_filing_type_codes:
+            docs_to_filter = [
+                doc
+                for doc in docs_to_filter
+                if doc.docTypeCode not in excluded_filing_type_codes
+            ]
+
+        # Handle require_sec_code since filter_filings doesn't support "require non-null"
+        if require_sec_code:
+            docs_to_filter = [doc for doc in docs_to_filter if doc.secCode is not None]
+
+        # Use filter_filings for all other filtering
+        filtered_docs = filter_filings(
+            docs_to_filter,
+            edinet_codes=edinet_codes,
+            doc_type_codes=filing_type_codes,
+            filer_names=filer_names,
+        )
+
+        self.logger.info(
+            "Added %s matching documents for %s", len(filtered_docs), current_date
+        )
+        return filtered_docs
+
+    def _handle_daily_error(
+        self, current_date: datetime.date, error: Exception
+    ) -> None:
+        """
+        Log a failure for a single day of a date range query.
+
+        Raises:
+            EdinetAuthenticationError: Re-raised immediately to stop execution.
+        """
+        if isinstance(error, EdinetAuthenticationError):
+            raise error
+        if isinstance(
+            error,
+            (EdinetConnectionError, EdinetRetryExceededError, EdinetDocumentFetchError),
+        ):
+            self.logger.error(
+                "API error processing documents for %s: %s", current_date, error
+            )
+        elif isinstance(error, (ValueError, TypeError)):
+            self.logger.error("Data validation error for %s: %s", current_date, error)
+        else:
+            self.logger.error(
+                "Unexpected error processing documents for %s: %s", current_date, error
+            )
+
+    def _validate_concurrency(self, concurrency: int) -> int:
+        """
+        Validate a concurrency setting and cap it at MAX_DOWNLOAD_CONCURRENCY.
+
+        Raises:
+            ValueError: If concurrency is not positive.
+        """
+        if concurrency <= 0:
+            raise ValueError("concurrency must be positive")
+        if concurrency > MAX_DOWNLOAD_CONCURRENCY:
+            self.logger.warning(
+                "Concurrency %s exceeds limit, using %s",
+                concurrency,
+                MAX_DOWNLOAD_CONCURRENCY,
+            )
+            return MAX_DOWNLOAD_CONCURRENCY
+        return concurrency
+
+    def _create_async_client(
+        self, concurrency: int, limiter: "_AdaptiveLimiter | None" = None
+    ) -> httpx.AsyncClient:
+        """
+        Create an async HTTP client sized for `concurrency` simultaneous requests.
+
+        If `limiter` is given, every response the client receives is reported
+        to it, so the limiter can adapt to server overload.
+        """
+        limits = httpx.Limits(
+            max_connections=concurrency,
+            max_keepalive_connections=concurrency,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_SECONDS,
+        )
+        return httpx.AsyncClient(
+            timeout=self.timeout,
+            limits=limits,
+            params=self._base_params,
+            http2=self.http2,
+            event_hooks={"response": [limiter.observe]} if limiter else None,
+        )
+
+    def _get_download_path(
+        self,
+        filing_metadata: FilingMetadata,
+        target_dir: str,
+    ) -> str | None:
+        """
+        Build the local file path for a filing download.
+
+        Returns:
+            Path in the format `{docID}-{docTypeCode}-{filerName}.zip`,
+            or None if any of the required metadata is missing. Characters
+            that are unsafe in filenames are replaced with `_` and long
+            filer names are truncated.
+        """
+        doc_id = filing_metadata.docID
+        doc_type_code = filing_metadata.docTypeCode
+        filer = filing_metadata.filerName
+
+        if not (doc_id and doc_type_code and filer):
+            return None
+
+        filer = _UNSAFE_FILENAME_CHARS.sub("_", filer[:MAX_FILENAME_FILER_CHARS])
+        filename = f"{doc_id}-{doc_type_code}-{filer}.zip"
+        return os.path.join(target_dir, filename)
+
+    async def _aget_zip_bytes(
+        self,
+        client: httpx.AsyncClient,
+        filing_metadata: FilingMetadata,
+    ) -> bytes:
+        """
+        Async counterpart of get_zip_bytes() using a shared async HTTP client.
+        """
+        doc_id = filing_metadata.docID
+        cache_key = f"document:{doc_id}:{API_CSV_DOCUMENT_TYPE}"
+
+        # Check cache first if enabled; file I/O runs in a worker thread so it
+        # does not block other downloads on the event loop
+        if self.cache_manager:
+            cached_bytes = await asyncio.to_thread(
+                self.cache_manager.get_binary, cache_key, CACHE_TTL_DOCUMENTS
+            )
+            if cached_bytes:
+                self.logger.info("Cache hit for document %s", doc_id)
+                return cached_bytes
+
+        url = _DOCUMENT_URL_PREFIX + doc_id
+        params = {"type": API_CSV_DOCUMENT_TYPE}
+
+        zip_bytes = await self._afetch_with_retry(
+            client,
+            url,
+            params,
+            return_content=True,
+        )
+        if not zip_bytes:
+            raise EdinetDocumentFetchError(f"Failed to fetch zip bytes for {doc_id}.")
+
+        # Cache the result if caching is enabled
+        if self.cache_manager:
+            if await asyncio.to_thread(
+                self.cache_manager.set_binary, cache_key, zip_bytes
+            ):
+                self.logger.info("Cached document %s", doc_id)
+
+        return zip_bytes
+
+    async def _astream_zip_to_file(
+        self,
+        client: httpx.AsyncClient,
+        filing_metadata: FilingMetadata,
+        filepath: str,
+    ) -> None:
+        """
+        Async counterpart of stream_zip_to_file() using a shared async HTTP client.
+        """
+        url = _DOCUMENT_URL_PREFIX + filing_metadata.docID
+        params = {"type": API_CSV_DOCUMENT_TYPE}
+
+        await self._astream_with_retry(client, url, params, filepath)
+
     def _validate_date(self, date: str | datetime.date) -> str:
         """
         Validate and convert date to string format.
@@ -498,27 +1214,146 @@ class EdinetClient:
             date: Date as string (YYYY-MM-DD) or datetime.date object.
 
         Returns:
-            Date string in YYYY-MM-DD format.
+            Date string in YYYY-MM-DD format; unpadded months and days
+            (e.g. "2024-1-5") are zero-padded.
 
         Raises:
             ValidationError: If date format is invalid.
         """
         if isinstance(date, str):
-            try:
-                datetime.datetime.strptime(date, "%Y-%m-%d")
-                return date
-            except ValueError as e:
-                raise ValidationError(
-                    f"Invalid date string. Use format 'YYYY-MM-DD'. Got: {date}"
-                ) from e
+            return _normalize_date_string(date)
         elif isinstance(date, datetime.date):
-            return date.strftime("%Y-%m-%d")
+            # Also covers datetime.datetime, whose isoformat() includes the time
+            return f"{date.year:04d}-{date.month:02d}-{date.day:02d}"
         else:
             # This should never happen
             raise ValidationError(
                 f"Date must be 'YYYY-MM-DD' string or datetime.date. Got: {type(date)}"
             )
 
+    def _get_retry_delay(
+        self, attempt: int, response: httpx.Response | None = None
+    ) -> float:
+        """
+        Compute how long to wait before the next retry attempt.
+
+        Uses exponential backoff from delay_seconds with +/-50% jitter, capped
+        at MAX_RETRY_DELAY_SECONDS. For 429/503 responses, a Retry-After
+        header raises the delay to at least the server's requested wait
+        (within the same cap) and pauses all other requests on this client
+        for the same period.
+
+        Args:
+            attempt: Zero-based index of the attempt that just failed.
+            response: The failed response, if one was received.
+
+        Returns:
+            Delay in seconds.
+        """
+        backoff = self.delay_seconds * 2**attempt * random.uniform(0.5, 1.5)
+        delay = min(backoff, MAX_RETRY_DELAY_SECONDS)
+
+        if response is not None and response.status_code in RETRY_AFTER_STATUS_CODES:
+            retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                delay = max(delay, min(retry_after, MAX_RETRY_DELAY_SECONDS))
+                self._rate_limited_until = max(
+                    self._rate_limited_until, time.monotonic() + delay
+                )
+
+        return delay
+
+    def _get_rate_limit_wait(self) -> float:
+        """Return the seconds left on a server-requested pause, or 0 if none."""
+        return max(0.0, self._rate_limited_until - time.monotonic())
+
+    def _classify_response(
+        self, response: httpx.Response, url: str, attempt: int
+    ) -> float | None:
+        """
+        Decide whether a retry loop accepts a response or retries the request.
+
+        Shared by the sync, async and streaming request loops, which only do
+        the I/O and the sleeping. Streaming callers must read the body of an
+        error response first so it can be logged.
+
+        Args:
+            response: Response received for the attempt.
+            url: Requested URL, for logging and error messages.
+            attempt: Zero-based index of the attempt.
+
+        Returns:
+            None if the response can be used, otherwise the delay in seconds
+            before the next attempt.
+
+        Raises:
+            EdinetConnectionError: If the status cannot be fixed by retrying.
+            httpx.HTTPStatusError: If the status is an error and this was the
+                last attempt.
+        """
+        if response.status_code != HTTP_SUCCESS:
+            self.logger.error(
+                "API returned status code %s for %s", response.status_code, url
+            )
+
+            try:
+                error_body = response.text
+                self.logger.error("Error body: %s", error_body)
+            except (AttributeError, UnicodeDecodeError):
+                self.logger.warning("Could not decode error response body")
+
+            # Retrying cannot fix a bad request, key or document ID
+            if response.status_code in NON_RETRYABLE_STATUS_CODES:
+                raise EdinetConnectionError(
+                    f"Failed {url} with status {response.status_code}"
+                )
+
+            # Check if retryable error
+            if (
+                HTTP_CLIENT_ERROR_START <= response.status_code < HTTP_SERVER_ERROR_END
+                and attempt < self.max_retries - 1
+            ):
+                delay = self._get_retry_delay(attempt, response)
+                self.logger.warning("Retrying in %.1fs...", delay)
+                return delay
+
+            response.raise_for_status()
+
+        # Debug only: bulk listings and downloads make one request per date or
+        # document, and the negotiated protocol rarely changes between them
+        self.logger.debug("Request to %s succeeded (%s)", url, response.http_version)
+        return None
+
+    def _get_error_retry_delay(self, error: Exception, url: str, attempt: int) -> float:
+        """
+        Log a failed attempt and return the delay before retrying it.
+
+        Args:
+            error: Network, protocol, HTTP status or JSON decoding error.
+            url: Requested URL, for logging and error messages.
+            attempt: Zero-based index of the attempt.
+
+        Returns:
+            Delay in seconds before the next attempt.
+
+        Raises:
+            EdinetConnectionError: If this was the last attempt.
+        """
+        if isinstance(error, httpx.HTTPError):
+            self.logger.error("HTTP Error in %s: %s", url, error)
+        else:
+            self.logger.error("Data processing error for %s: %s", url, error)
+
+        if attempt >= self.max_retries - 1:
+            self.logger.error("Max retries reached for %s", url)
+            raise EdinetConnectionError(
+                f"Failed {url} after {self.max_retries} attempts"
+            ) from error
+
+        delay = self._get_retry_delay(attempt)
+        self.logger.warning("Retrying in %.1fs...", delay)
+        return delay
+
     def _fetch_with_retry(
         self,
         url: str,
@@ -542,74 +1377,316 @@ class EdinetClient:
         """
         for attempt in range(self.max_retries):
             try:
-                self.logger.info(f"Attempt {attempt + 1} for {url}...")
+                self.logger.debug("Attempt %s for %s...", attempt + 1, url)
+                if wait := self._get_rate_limit_wait():
+                    time.sleep(wait)
+
+                response = self._client.get(url, params=params)
+                delay = self._classify_response(response, url, attempt)
+                if delay is not None:
+                    time.sleep(delay)
+                    continue
+
+                return (
+                    response.content if return_content else loads_json(response.content)
+                )
+
+            except _RETRYABLE_ERRORS as e:
+                time.sleep(self._get_error_retry_delay(e, url, attempt))
+
+        raise EdinetRetryExceededError(f"Failed {url} after multiple retries")
+
+    async def _afetch_with_retry(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        params: dict[str, str],
+        return_content: bool = False,
+    ) -> Any:
+        """
+        Async counterpart of _fetch_with_retry() using a shared async HTTP client.
+
+        Raises:
+            EdinetConnectionError: If connection fails after all retries.
+            EdinetRetryExceededError: If retry limit is exceeded.
+        """
+        for attempt in range(self.max_retries):
+            try:
+                self.logger.debug("Attempt %s for %s...", attempt + 1, url)
+                if wait := self._get_rate_limit_wait():
+                    await asyncio.sleep(wait)
+
+                response = await client.get(url, params=params)
+                delay = self._classify_response(response, url, attempt)
+                if delay is not None:
+                    await asyncio.sleep(delay)
+                    continue
+
+                return (
+                    response.content if return_content else loads_json(response.content)
+                )
+
+            except _RETRYABLE_ERRORS as e:
+                await asyncio.sleep(self._get_error_retry_delay(e, url, attempt))
+
+        raise EdinetRetryExceededError(f"Failed {url} after multiple retries")
+
+    def _stream_with_retry(
+        self,
+        url: str,
+        params: dict[str, str],
+        filepath: str,
+    ) -> None:
+        """
+        Stream a response body to a file with retry logic.
 
-                with httpx.Client(timeout=self.timeout) as client:
-                    response = client.get(url, params=params)
+        The body is written to a `.part` file next to `filepath` and moved into
+        place once complete, so an interrupted download never leaves a
+        truncated file that later runs would skip as already downloaded.
+
+        Raises:
+            EdinetConnectionError: If the download fails after all retries.
+            EdinetRetryExceededError: If retry limit is exceeded.
+        """
+        part_path = f"{filepath}.part"
+
+        for attempt in range(self.max_retries):
+            try:
+                self.logger.debug("Attempt %s for %s...", attempt + 1, url)
+                if wait := self._get_rate_limit_wait():
+                    time.sleep(wait)
 
+                with self._client.stream("GET", url, params=params) as response:
                     if response.status_code != HTTP_SUCCESS:
-                        self.logger.error(
-                            f"API returned status code {response.status_code} for {url}"
-                        )
+                        # Error bodies are small; read them so they can be logged
+                        response.read()
+                    delay = self._classify_response(response, url, attempt)
+                    if delay is None:
+                        with open(part_path, "wb") as f:
+                            for chunk in response.iter_bytes(DOWNLOAD_CHUNK_SIZE):
+                                f.write(chunk)
+
+                # Wait outside the stream so its connection goes back to the pool
+                if delay is not None:
+                    time.sleep(delay)
+                    continue
+
+                os.replace(part_path, filepath)
+                return
+
+            except _RETRYABLE_ERRORS as e:
+                _remove_partial_file(part_path)
+                time.sleep(self._get_error_retry_delay(e, url, attempt))
+            except Exception:
+                # Not retryable (e.g. a local file error); clean up and propagate
+                _remove_partial_file(part_path)
+                raise
+
+        raise EdinetRetryExceededError(f"Failed {url} after multiple retries")
+
+    async def _astream_with_retry(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        params: dict[str, str],
+        filepath: str,
+    ) -> None:
+        """
+        Async counterpart of _stream_with_retry() using a shared async HTTP client.
+
+        File writes run in worker threads so they do not block other downloads
+        on the event loop.
+
+        Raises:
+            EdinetConnectionError: If the download fails after all retries.
+            EdinetRetryExceededError: If retry limit is exceeded.
+        """
+        part_path = f"{filepath}.part"
+
+        for attempt in range(self.max_retries):
+            try:
+                self.logger.debug("Attempt %s for %s...", attempt + 1, url)
+                if wait := self._get_rate_limit_wait():
+                    await asyncio.sleep(wait)
 
+                async with client.stream("GET", url, params=params) as response:
+                    if response.status_code != HTTP_SUCCESS:
+                        # Error bodies are small; read them so they can be logged
+                        await response.aread()
+                    delay = self._classify_response(response, url, attempt)
+                    if delay is None:
+                        f = await asyncio.to_thread(open, part_path, "wb")
                         try:
-                            error_body = response.text
-                            self.logger.error(f"Error body: {error_body}")
-                        except (AttributeError, UnicodeDecodeError):
-                            self.logger.warning("Could not decode error response body")
-
-                        # Check if retryable error
-                        if (
-                            HTTP_CLIENT_ERROR_START
-                            <= response.status_code
-                            < HTTP_SERVER_ERROR_END
-                            and attempt < self.max_retries - 1
-                        ):
-                            self.logger.warning(f"Retrying in {self.delay_seconds}s...")
-                            time.sleep(self.delay_seconds)
-                            continue
-                        else:
-                            response.raise_for_status()
-
-                    if return_content:
-                        content = response.content
-                        self.logger.info(f"Successfully completed {url}")
-                        return content
-                    else:
-                        data = response.json()
-                        self.logger.info(f"Successfully completed {url}")
-                        return data
-
-            except httpx.HTTPError as e:
-                self.logger.error(f"HTTP Error in {url}: {e}")
-                if attempt < self.max_retries - 1:
-                    self.logger.warning(f"Retrying in {self.delay_seconds}s...")
-                    time.sleep(self.delay_seconds)
-                else:
-                    self.logger.error(f"Max retries reached for {url}")
-                    raise EdinetConnectionError(
-                        f"Failed {url} after {self.max_retries} attempts"
-                    ) from e
-
-            except (ValueError, TypeError, KeyError) as e:
-                self.logger.error(f"Data processing error for {url}: {e}")
-                if attempt < self.max_retries - 1:
-                    self.logger.warning(f"Retrying in {self.delay_seconds}s...")
-                    time.sleep(self.delay_seconds)
-                else:
-                    self.logger.error(f"Max retries reached for {url}")
-                    raise EdinetConnectionError(
-                        f"Failed {url} after {self.max_retries} attempts"
-                    ) from e
-            except Exception as e:
-                self.logger.error(f"Unexpected error in {url}: {e}")
-                if attempt < self.max_retries - 1:
-                    self.logger.warning(f"Retrying in {self.delay_seconds}s...")
-                    time.sleep(self.delay_seconds)
-                else:
-                    self.logger.error(f"Max retries reached for {url}")
-                    raise EdinetConnectionError(
-                        f"Failed {url} after {self.max_retries} attempts"
-                    ) from e
+                            async for chunk in response.aiter_bytes(
+                                DOWNLOAD_CHUNK_SIZE
+                            ):
+                                await asyncio.to_thread(f.write, chunk)
+                        finally:
+                            await asyncio.to_thread(f.close)
+
+                # Wait outside the stream so its connection goes back to the pool
+                if delay is not None:
+                    await asyncio.sleep(delay)
+                    continue
+
+                await asyncio.to_thread(os.replace, part_path, filepath)
+                return
+
+            except _RETRYABLE_ERRORS as e:
+                await asyncio.to_thread(_remove_partial_file, part_path)
+                await asyncio.sleep(self._get_error_retry_delay(e, url, attempt))
+            except Exception:
+                # Not retryable (e.g. a local file error); clean up and propagate
+                await asyncio.to_thread(_remove_partial_file, part_path)
+                raise
 
         raise EdinetRetryExceededError(f"Failed {url} after multiple retries")
+
+
+def _remove_partial_file(path: str) -> None:
+    """Delete a partially written download, ignoring files that cannot be removed."""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _date_range(
+    start_date: datetime.date, end_date: datetime.date
+) -> list[datetime.date]:
+    """Return every date from start_date to end_date, inclusive."""
+    return [
+        start_date + datetime.timedelta(days=i)
+        for i in range((end_date - start_date).days + 1)
+    ]
+
+
+@functools.lru_cache(maxsize=1024)
+def _normalize_date_string(date: str) -> str:
+    """
+    Validate a YYYY-MM-DD date string and return it zero-padded.
+
+    Memoized, since date ranges and repeated queries validate the same few
+    strings over and over.
+
+    Raises:
+        ValidationError: If the string is not a valid date.
+    """
+    # Fast path for canonical YYYY-MM-DD; fromisoformat() also takes other
+    # ISO shapes (e.g. week dates), hence the round-trip check
+    try:
+        if datetime.date.fromisoformat(date).isoformat() == date:
+            return date
+    except ValueError:
+        pass
+    # Unpadded months and days, as strptime("%Y-%m-%d") allowed
+    match = _DATE_PATTERN.fullmatch(date)
+    if match is not None:
+        try:
+            # date() rejects out-of-range months and days
+            return datetime.date(*map(int, match.groups())).isoformat()
+        except ValueError:
+            pass
+    raise ValidationError(f"Invalid date string. Use format 'YYYY-MM-DD'. Got: {date}")
+
+
+def _unique_by_doc_id(
+    filing_metadatas: list[FilingMetadata],
+) -> list[FilingMetadata]:
+    """Drop filings whose docID already appeared earlier in the list."""
+    unique: dict[str, FilingMetadata] = {}
+    for filing_metadata in filing_metadatas:
+        unique.setdefault(filing_metadata.docID, filing_metadata)
+    return list(unique.values())
+
+
+def _scan_downloaded_doc_ids(target_dir: str) -> set[str]:
+    """
+    Collect the docIDs of ZIPs already in a download directory.
+
+    Download filenames start with `{docID}-` and EDINET docIDs contain no
+    hyphen, so the ID is everything before the first one.
+    """
+    with os.scandir(target_dir) as entries:
+        return {
+            entry.name.split("-", 1)[0]
+            for entry in entries
+            if entry.name.endswith(ZIP_EXTENSION)
+        }
+
+
+def _validate_cached_filings(
+    data: Any,
+) -> EdinetSuccessResponse | EdinetErrorResponse | None:
+    """Validate a cached filings payload; an empty payload counts as a cache miss."""
+    if not data:
+        return None
+    # Return appropriate response type based on cached data
+    if "results" in data:
+        return EdinetSuccessResponse.model_validate(data)
+    return EdinetErrorResponse.model_validate(data)
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header given as seconds or an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=datetime.UTC)
+    return max(0.0, (retry_at - datetime.datetime.now(datetime.UTC)).total_seconds())
+
+
+class _AdaptiveLimiter:
+    """
+    Async concurrency limiter sized by AIMD (additive increase, multiplicative decrease).
+
+    Acts like an asyncio.Semaphore of `max_limit` permits whose size halves
+    when the server signals overload (429/503) and grows back by about one
+    permit per window of successful responses. Decreases are rate-limited to
+    one per ADAPTIVE_CONCURRENCY_COOLDOWN_SECONDS, so a burst of rejections
+    from requests that were already in flight counts as a single signal.
+    """
+
+    def __init__(self, max_limit: int) -> None:
+        self._max_limit = max_limit
+        self._limit = float(max_limit)
+        self._in_flight = 0
+        self._last_decrease = float("-inf")
+        self._condition = asyncio.Condition()
+
+    async def __aenter__(self) -> None:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < int(self._limit))
+            self._in_flight += 1
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        async with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    async def observe(self, response: httpx.Response) -> None:
+        """httpx response hook that adjusts the limit from the status code."""
+        if response.status_code in RETRY_AFTER_STATUS_CODES:
+            now = time.monotonic()
+            if now - self._last_decrease >= ADAPTIVE_CONCURRENCY_COOLDOWN_SECONDS:
+                self._last_decrease = now
+                self._limit = max(1.0, self._limit / 2)
+                logger.warning(
+                    "Server overloaded, reducing concurrency to %s", int(self._limit)
+                )
+        elif response.status_code == HTTP_SUCCESS:
+            # Waiters are woken when the current holder releases its permit
+            self._limit = min(float(self._max_limit), self._limit + 1 / self._limit)
@@ -12,18 +12,20 @@ def handle_api_errors[T](func: Callable[..., T]) -> Callable[..., T]:
             return func(*args, **kwargs)
         except ConnectionError as e:
             logging.getLogger(__name__).error(
-                f"Connection error in {func.__name__}: {e}"
+                "Connection error in %s: %s", func.__name__, e
             )
             raise
         except TimeoutError as e:
-            logging.getLogger(__name__).error(f"Timeout error in {func.__name__}: {e}")
+            logging.getLogger(__name__).error(
+                "Timeout error in %s: %s", func.__name__, e
+            )
             raise
         except ValueError as e:
-            logging.getLogger(__name__).error(f"Value error in {func.__name__}: {e}")
+            logging.getLogger(__name__).error("Value error in %s: %s", func.__name__, e)
             raise
         except Exception as e:
             logging.getLogger(__name__).error(
-                f"Unexpected error in {func.__name__}: {e}"
+                "Unexpected error in %s: %s", func.__name__, e
             )
             raise
 
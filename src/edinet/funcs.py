@@ -1,3 +1,5 @@
+from collections.abc import Collection
+
 from src.models import FilingMetadata
 from src.utils import snake_to_camel
 
@@ -9,7 +11,7 @@ def filter_filings(
     sec_codes: list[str] | None = None,
     filer_names: list[str] | None = None,
     form_codes: list[str] | None = None,
-    doc_type_codes: list[str] | None = None,  # the filing type codes
+    doc_type_codes: Collection[str] | None = None,  # the filing type codes
     doc_descriptions: list[str] | None = None,
 ) -> list[FilingMetadata]:
     """
@@ -40,16 +42,25 @@ def filter_filings(
         "doc_descriptions": doc_descriptions,
     }
 
+    # Resolve attribute names once and keep only the filters that were provided.
+    # Each filter also gets a hash set so exact matches (the usual case for
+    # codes and IDs) skip the substring scan over every filter value.
+    active_filters = [
+        (snake_to_camel(filter_name), filter_values, frozenset(filter_values))
+        for filter_name, filter_values in filters.items()
+        if filter_values is not None
+    ]
+
     def matches_all_filters(filing: FilingMetadata) -> bool:
         """Check if filing matches all provided filters (AND combination)."""
-        return all(
-            filter_values is None
-            or any(
-                value in getattr(filing, snake_to_camel(filter_name))
-                for value in filter_values
-                if getattr(filing, snake_to_camel(filter_name)) is not None
-            )
-            for filter_name, filter_values in filters.items()
-        )
+        for attr_name, filter_values, exact_values in active_filters:
+            attr_value = getattr(filing, attr_name)
+            if attr_value is None:
+                return False
+            if attr_value in exact_values:
+                continue
+            if not any(value in attr_value for value in filter_values):
+                return False
+        return True
 
     return [filing for filing in all_filings if matches_all_filters(filing)]
@@ -1,11 +1,12 @@
 """EDINET API schemas and exception classes."""
 
 import logging
+import sys
 from collections.abc import Hashable
 from types import TracebackType
-from typing import Any
+from typing import Annotated, Any
 
-from pydantic import BaseModel, field_validator
+from pydantic import AfterValidator, BaseModel, ConfigDict, field_validator
 
 from src.utils import clean_text
 
@@ -31,10 +32,16 @@ CsvFileAsRecords = list[Record]
 # We will define methods in terms of the Filing class.
 FilenameRecords = dict[str, CsvFileAsRecords]
 
+# Low-cardinality codes repeated across thousands of filings share one string
+InternedStr = Annotated[str, AfterValidator(sys.intern)]
+
 
 class File(BaseModel):
     """A single document within a filing."""
 
+    # Only needed when parsing ZIPs; build the schema on first use
+    model_config = ConfigDict(defer_build=True)
+
     filename: str
     records: CsvFileAsRecords
 
@@ -43,18 +50,23 @@ class FilingMetadata(BaseModel):
     """
     Metadata structure for EDINET API responses for documents.
     Note that a "document" is a zip file that could contain multiple files.
+
+    Instances are immutable and hashable, so they can be shared across
+    threads and worker processes and used as dict keys or set members.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     seqNumber: int  # noqa: N815
     docID: str  # noqa: N815
-    edinetCode: str | None  # noqa: N815
+    edinetCode: InternedStr | None  # noqa: N815
     secCode: str | None  # noqa: N815
     JCN: str | None
     filerName: str | None  # noqa: N815
     fundCode: str | None  # noqa: N815
-    ordinanceCode: str | None  # noqa: N815
-    formCode: str | None  # noqa: N815
-    docTypeCode: str | None  # noqa: N815
+    ordinanceCode: InternedStr | None  # noqa: N815
+    formCode: InternedStr | None  # noqa: N815
+    docTypeCode: InternedStr | None  # noqa: N815
     periodStart: str | None  # noqa: N815
     periodEnd: str | None  # noqa: N815
     submitDateTime: str | None  # noqa: N815
@@ -90,6 +102,8 @@ class Filing(BaseModel):
     A filing is a zip file that could contain multiple files.
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     metadata: FilingMetadata
     files: list[File]
 
@@ -133,6 +147,9 @@ class EdinetSuccessResponse(BaseModel):
 class EdinetErrorResponse(BaseModel):
     """Error response structure from EDINET API."""
 
+    # Only built when the API actually returns an error
+    model_config = ConfigDict(defer_build=True)
+
     statusCode: int  # noqa: N815
     message: str
 
@@ -197,7 +214,7 @@ class ErrorContext:
         self.reraise = reraise
 
     def __enter__(self) -> "ErrorContext":
-        self.logger.debug(f"Starting operation: {self.operation_name}")
+        self.logger.debug("Starting operation: %s", self.operation_name)
         return self
 
     def __exit__(
@@ -208,13 +225,15 @@ class ErrorContext:
     ) -> bool | None:
         if exc_type is not None:
             self.logger.error(
-                f"Operation '{self.operation_name}' failed: {exc_val}",
+                "Operation '%s' failed: %s",
+                self.operation_name,
+                exc_val,
                 exc_info=exc_val,
             )
             if not self.reraise:
                 return True  # Suppress exception
         else:
             self.logger.debug(
-                f"Operation completed successfully: {self.operation_name}"
+                "Operation completed successfully: %s", self.operation_name
             )
         return None  # Don't suppress exception
@@ -3,20 +3,28 @@ import io
 import logging
 import os
 import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import IO
 
 import chardet
 import pandas as pd
 
 from src.config import (
     AUDITOR_REPORT_PREFIX,
+    CSV_ENCODING_DETECTION_BYTES,
     CSV_EXTENSION,
     CSV_SEPARATOR,
     MACOS_METADATA_DIR,
+    MIN_ZIP_FILES_FOR_PROCESS_POOL,
 )
 from src.models import CsvFileAsRecords, File, Filing, FilingMetadata
 
 logger = logging.getLogger(__name__)
 
+# ZIP member prefix for macOS resource-fork entries, built once at import
+_MACOS_METADATA_PREFIX = f"{MACOS_METADATA_DIR}/"
+
 
 class BaseProcessor:
     """
@@ -62,40 +70,14 @@ class BaseProcessor:
         Returns:
             List of records, or None if processing failed.
         """
-        doc_id = filing_metadata.docID
-        files: list[File] = []
-
         try:
-            # Create a BytesIO object from the zip bytes
-            zip_buffer = io.BytesIO(zip_bytes)
-
-            with zipfile.ZipFile(zip_buffer, "r") as zip_ref:
-                # Get list of all files in the zip
-                file_list = zip_ref.namelist()
-                file_list_filtered = cls._filter_csv_files(file_list)
-
-                if not file_list_filtered:
-                    logger.warning(f"No CSV files found in ZIP for doc {doc_id}")
-                    return None
-
-                for csv_filename in file_list_filtered:
-                    basename = os.path.basename(csv_filename)
-                    if cls._should_skip_auditor_file(basename):
-                        continue
-
-                    csv_bytes_undecoded = zip_ref.read(csv_filename)
-                    records = cls.csv_bytes_to_records(
-                        csv_bytes_undecoded,
-                        basename,
-                    )
-                    if records is not None:
-                        file = File(filename=basename, records=records)
-                        files.append(file)
-
-                return Filing(metadata=filing_metadata, files=files)
-
+            return cls._zip_to_filing(io.BytesIO(zip_bytes), filing_metadata)
         except Exception as e:
-            logger.error(f"Critical error processing ZIP bytes for doc {doc_id}: {e}")
+            logger.error(
+                "Critical error processing ZIP bytes for doc %s: %s",
+                filing_metadata.docID,
+                e,
+            )
             return None
 
     @classmethod
@@ -111,22 +93,34 @@ class BaseProcessor:
                 return cls._csv_bytes_to_records_with_encoding(csv_bytes, encoding)
             else:
                 # Try common encodings if no encoding is detected
-                for encoding in cls.COMMON_ENCODINGS:
-                    try:
-                        return cls._csv_bytes_to_records_with_encoding(
-                            csv_bytes, encoding
-                        )
-                    except Exception as e:
-                        logger.debug(
-                            f"Failed to read {filename} with encoding {encoding}: {e}"
-                        )
-                        continue
-
-                logger.error(
-                    f"Failed to read {filename}. Unable to determine correct encoding or format."
+                return cls._csv_bytes_to_records_with_fallback(
+                    csv_bytes, cls.COMMON_ENCODINGS, filename
                 )
         except Exception as e:
-            logger.error(f"Error reading CSV file {filename}: {e}")
+            logger.error("Error reading CSV file %s: %s", filename, e)
+        return None
+
+    @classmethod
+    def _csv_bytes_to_records_with_fallback(
+        cls,
+        csv_bytes: bytes,
+        encodings: list[str],
+        filename: str,
+    ) -> CsvFileAsRecords | None:
+        """Decode csv bytes with the first of `encodings` that works."""
+        for encoding in encodings:
+            try:
+                return cls._csv_bytes_to_records_with_encoding(csv_bytes, encoding)
+            except Exception as e:
+                logger.debug(
+                    "Failed to read %s with encoding %s: %s", filename, encoding, e
+                )
+                continue
+
+        logger.error(
+            "Failed to read %s. Unable to determine correct encoding or format.",
+            filename,
+        )
         return None
 
     @classmethod
@@ -154,16 +148,9 @@ class BaseProcessor:
     ) -> Filing | None:
         """Read a zipfile and return a Filing object."""
         try:
-            with open(zip_file_path, "rb") as f:
-                zip_bytes = f.read()
-
-            return cls.zip_bytes_to_filing(
-                zip_bytes=zip_bytes,
-                filing_metadata=filing_metadata,
-            )
-
+            return cls._zip_to_filing(zip_file_path, filing_metadata)
         except Exception as e:
-            logger.error(f"Error reading ZIP file {zip_file_path}: {e}")
+            logger.error("Error reading ZIP file %s: %s", zip_file_path, e)
             return None
 
     @classmethod
@@ -171,18 +158,139 @@ class BaseProcessor:
         cls,
         zip_directory_path: str,
         filing_metadata: FilingMetadata,
+        max_workers: int | None = None,
     ) -> list[Filing] | None:
-        """Read zip files from a directory and return a list of Filing objects."""
-        all_filings: list[Filing] = []
-        for zip_file_path in os.listdir(zip_directory_path):
-            filing = cls.zip_file_to_filing(
-                zip_file_path=os.path.join(zip_directory_path, zip_file_path),
-                filing_metadata=filing_metadata,
-            )
-            if filing:
-                all_filings.append(filing)
+        """
+        Read zip files from a directory and return a list of Filing objects.
+
+        Each ZIP is parsed in its own worker process, since CSV parsing is
+        CPU-bound and independent per file. Filings are returned in directory
+        listing order; a single ZIP is parsed in-process.
+
+        Args:
+            zip_directory_path: Directory containing the ZIP files.
+            filing_metadata: The metadata to attach to each filing.
+            max_workers: Number of worker processes. If None, uses os.cpu_count().
+        """
+        zip_file_paths = [
+            os.path.join(zip_directory_path, zip_file_path)
+            for zip_file_path in os.listdir(zip_directory_path)
+        ]
+        if not zip_file_paths:
+            return None
+
+        if len(zip_file_paths) < MIN_ZIP_FILES_FOR_PROCESS_POOL:
+            filings = [
+                cls.zip_file_to_filing(path, filing_metadata) for path in zip_file_paths
+            ]
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                # map() yields results in input order, unlike as_completed()
+                filings = list(
+                    executor.map(
+                        _zip_file_to_filing, zip_file_paths, repeat(filing_metadata)
+                    )
+                )
+
+        all_filings = [filing for filing in filings if filing]
         return all_filings if all_filings else None
 
+    @classmethod
+    def _zip_to_filing(
+        cls,
+        zip_source: str | IO[bytes],
+        filing_metadata: FilingMetadata,
+    ) -> Filing | None:
+        """
+        Extract CSVs from a ZIP path or file object, streaming each member.
+
+        CSV members are decoded and parsed straight from the archive so the
+        decompressed bytes are never held in memory as a whole.
+        """
+        doc_id = filing_metadata.docID
+        files: list[File] = []
+
+        with zipfile.ZipFile(zip_source, "r") as zip_ref:
+            # Get list of all files in the zip
+            file_list = zip_ref.namelist()
+            file_list_filtered = cls._filter_csv_files(file_list)
+
+            if not file_list_filtered:
+                logger.warning("No CSV files found in ZIP for doc %s", doc_id)
+                return None
+
+            for csv_filename in file_list_filtered:
+                basename = os.path.basename(csv_filename)
+                if cls._should_skip_auditor_file(basename):
+                    continue
+
+                records = cls._zip_member_to_records(zip_ref, csv_filename, basename)
+                if records is not None:
+                    file = File(filename=basename, records=records)
+                    files.append(file)
+
+        return Filing(metadata=filing_metadata, files=files)
+
+    @classmethod
+    def _zip_member_to_records(
+        cls,
+        zip_ref: zipfile.ZipFile,
+        member_name: str,
+        filename: str,
+    ) -> CsvFileAsRecords | None:
+        """Stream a tab-separated CSV out of a ZIP archive, detecting its encoding."""
+        try:
+            with zip_ref.open(member_name) as member:
+                # Detect from the head, then rewind; ZipExtFile only has to
+                # decompress those few bytes again before parsing streams on
+                head = member.read(CSV_ENCODING_DETECTION_BYTES)
+                member.seek(0)
+                # An ASCII head just means any non-ASCII text starts later;
+                # UTF-8 is the ASCII-compatible superset to try first
+                encoding = chardet.detect(head)["encoding"] or "ascii"
+                head_is_ascii = encoding.lower() == "ascii"
+                if head_is_ascii:
+                    encoding = "utf-8"
+                try:
+                    return cls._csv_stream_to_records_with_encoding(member, encoding)
+                except Exception as e:
+                    logger.debug(
+                        "Failed to read %s with encoding %s: %s", filename, encoding, e
+                    )
+
+            # The head guess did not hold for the whole member; read it once
+            # more and try the remaining common encodings on those bytes.
+            # UTF-16 would silently misread text that starts with ASCII.
+            fallbacks = [
+                e
+                for e in cls.COMMON_ENCODINGS
+                if e != encoding and not (head_is_ascii and e.startswith("utf-16"))
+            ]
+            return cls._csv_bytes_to_records_with_fallback(
+                zip_ref.read(member_name), fallbacks, filename
+            )
+        except Exception as e:
+            logger.error("Error reading CSV file %s: %s", filename, e)
+        return None
+
+    @classmethod
+    def _csv_stream_to_records_with_encoding(
+        cls,
+        csv_stream: IO[bytes],
+        encoding: str = "utf-8",
+    ) -> CsvFileAsRecords | None:
+        """Parse a binary CSV stream incrementally using the given encoding."""
+        # ZipFile.open() already returns a buffered ZipExtFile
+        text_stream = io.TextIOWrapper(csv_stream, encoding=encoding)
+        df = pd.read_csv(
+            text_stream,
+            sep=CSV_SEPARATOR,
+            dtype=str,
+            low_memory=False,
+        )
+        df = df.replace({float("nan"): None, "": None})
+        return df.to_dict(orient="records")
+
     @staticmethod
     def _filter_csv_files(file_list: list[str]) -> list[str]:
         """Filter for CSV files, excluding system metadata directories."""
@@ -190,15 +298,14 @@ class BaseProcessor:
             filename
             for filename in file_list
             if filename.endswith(CSV_EXTENSION)
-            and not filename.startswith(f"{MACOS_METADATA_DIR}/")
-            and not filename.startswith("__MACOSX/")
+            and not filename.startswith(_MACOS_METADATA_PREFIX)
         ]
 
     @staticmethod
     def _should_skip_auditor_file(basename: str) -> bool:
         """Check if file should be skipped (auditor reports)."""
         if basename.startswith(AUDITOR_REPORT_PREFIX):
-            logger.debug(f"Skipping auditor report file: {basename}")
+            logger.debug("Skipping auditor report file: %s", basename)
             return True
         return False
 
@@ -273,3 +380,11 @@ class BaseProcessor:
     #             )
 
     #     return text_blocks
+
+
+def _zip_file_to_filing(
+    zip_file_path: str,
+    filing_metadata: FilingMetadata,
+) -> Filing | None:
+    """Process a single ZIP file; module-level so it can be pickled for workers."""
+    return BaseProcessor.zip_file_to_filing(zip_file_path, filing_metadata)
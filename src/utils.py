@@ -1,4 +1,11 @@
+import json
 import logging
+from typing import Any
+
+try:
+    import orjson  # type: ignore[import-not-found, unused-ignore]
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None  # type: ignore[assignment]
 
 from src.config import LOG_FORMAT, TEXT_REPLACEMENTS
 
@@ -38,3 +45,17 @@ def snake_to_camel(s: str, remove_trailing_s: bool = True) -> str:
     if remove_trailing_s and base.endswith("s"):
         return base[:-1]
     return base
+
+
+def dumps_json(data: Any) -> bytes:
+    """Serialize data to compact UTF-8 JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads_json(data: bytes) -> Any:
+    """Deserialize UTF-8 JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,95 @@
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+import httpx
+import pytest
+
+from src.edinet import client as client_module
+from src.edinet.client import EdinetClient
+from src.models import FilingMetadata
+
+type Handler = Callable[[httpx.Request], httpx.Response]
+
+
+def _filing_metadata(**overrides) -> FilingMetadata:
+    """Build filing metadata with every field EDINET always sends filled in."""
+    fields = {
+        "seqNumber": 1,
+        "docID": "S100ABCD",
+        "edinetCode": "E02144",
+        "secCode": "72030",
+        "JCN": None,
+        "filerName": "トヨタ自動車株式会社",
+        "fundCode": None,
+        "ordinanceCode": "010",
+        "formCode": "043000",
+        "docTypeCode": "160",
+        "periodStart": None,
+        "periodEnd": None,
+        "submitDateTime": "2024-01-05 15:00",
+        "docDescription": None,
+        "issuerEdinetCode": None,
+        "subjectEdinetCode": None,
+        "subsidiaryEdinetCode": None,
+        "currentReportReason": None,
+        "parentDocID": None,
+        "opeDateTime": None,
+        "withdrawalStatus": "0",
+        "docInfoEditStatus": "0",
+        "disclosureStatus": "0",
+        "xbrlFlag": "1",
+        "pdfFlag": "1",
+        "attachDocFlag": "0",
+        "englishDocFlag": "0",
+        "csvFlag": "1",
+        "legalStatus": "1",
+    }
+    fields.update(overrides)
+    return FilingMetadata.model_validate(fields)
+
+
+@pytest.fixture
+def make_filing_metadata() -> Callable[..., FilingMetadata]:
+    """Build filing metadata, overriding fields by keyword."""
+    return _filing_metadata
+
+
+@pytest.fixture
+def filing_metadata() -> FilingMetadata:
+    return _filing_metadata()
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Record retry sleeps instead of waiting them out."""
+    recorded: list[float] = []
+    monkeypatch.setattr(client_module.time, "sleep", recorded.append)
+    return recorded
+
+
+@pytest.fixture
+def make_client(tmp_path: Path) -> Iterator[Callable[..., EdinetClient]]:
+    """Build EdinetClients whose HTTP requests are answered by a handler."""
+    clients: list[EdinetClient] = []
+
+    def factory(handler: Handler, **kwargs) -> EdinetClient:
+        kwargs.setdefault("enable_cache", False)
+        kwargs.setdefault("delay_seconds", 0)
+        client = EdinetClient(
+            api_key="test-key",
+            download_dir=str(tmp_path / "downloads"),
+            cache_dir=str(tmp_path / "cache"),
+            enable_http2=False,
+            **kwargs,
+        )
+        client._client.close()
+        client._client = httpx.Client(
+            transport=httpx.MockTransport(handler), params=client._base_params
+        )
+        clients.append(client)
+        return client
+
+    yield factory
+
+    for client in clients:
+        client.close()
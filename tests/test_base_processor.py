@@ -0,0 +1,94 @@
+import io
+import os
+import zipfile
+
+import pytest
+
+from src.processors.base_processor import BaseProcessor
+
+ROWS = [("jpcrp_cor:CompanyName", "トヨタ自動車株式会社"), ("jpcrp_cor:Revenue", "100")]
+
+
+def make_csv(encoding: str, ascii_rows: int = 0) -> bytes:
+    """Build a tab-separated CSV, optionally led by enough ASCII rows to fill the head."""
+    lines = ["要素ID\t値"] if not ascii_rows else ["element_id\tvalue"]
+    lines += [f"ascii:Element{i}\t{i}" for i in range(ascii_rows)]
+    lines += [f"{element_id}\t{value}" for element_id, value in ROWS]
+    return ("\n".join(lines) + "\n").encode(encoding)
+
+
+def make_zip(members: dict[str, bytes]) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
+        for name, data in members.items():
+            zip_file.writestr(name, data)
+    return buffer.getvalue()
+
+
+def test_reads_utf16_member(filing_metadata):
+    zip_bytes = make_zip({"XBRL_TO_CSV/jpcrp030000.csv": make_csv("utf-16")})
+
+    filing = BaseProcessor.zip_bytes_to_filing(zip_bytes, filing_metadata)
+    assert filing is not None
+    [file] = filing.files
+    assert file.filename == "jpcrp030000.csv"
+    assert file.records == [{"要素ID": k, "値": v} for k, v in ROWS]
+
+
+@pytest.mark.parametrize("encoding", ["utf-8", "cp932"])
+def test_falls_back_when_head_is_ascii(filing_metadata, encoding):
+    # The first KiB is pure ASCII; the Japanese text only starts after it
+    csv_bytes = make_csv(encoding, ascii_rows=100)
+    assert csv_bytes[:1024].isascii()
+    zip_bytes = make_zip({"XBRL_TO_CSV/jpcrp030000.csv": csv_bytes})
+
+    filing = BaseProcessor.zip_bytes_to_filing(zip_bytes, filing_metadata)
+    assert filing is not None
+    [file] = filing.files
+    assert file.records is not None
+    assert file.records[-2]["value"] == "トヨタ自動車株式会社"
+
+
+def test_skips_auditor_reports_and_non_csv_members(filing_metadata):
+    zip_bytes = make_zip(
+        {
+            "XBRL_TO_CSV/jpcrp030000.csv": make_csv("utf-16"),
+            "XBRL_TO_CSV/jpaud-aai-cc-001.csv": make_csv("utf-16"),
+            "XBRL_TO_CSV/readme.txt": b"not a csv",
+            "__MACOSX/XBRL_TO_CSV/._jpcrp030000.csv": b"\x00\x05\x16\x07",
+        }
+    )
+
+    filing = BaseProcessor.zip_bytes_to_filing(zip_bytes, filing_metadata)
+    assert filing is not None
+    assert [file.filename for file in filing.files] == ["jpcrp030000.csv"]
+
+
+def test_zip_file_matches_zip_bytes(filing_metadata, tmp_path):
+    zip_bytes = make_zip({"XBRL_TO_CSV/jpcrp030000.csv": make_csv("utf-16")})
+    zip_path = tmp_path / "S100ABCD.zip"
+    zip_path.write_bytes(zip_bytes)
+
+    assert BaseProcessor.zip_file_to_filing(
+        str(zip_path), filing_metadata
+    ) == BaseProcessor.zip_bytes_to_filing(zip_bytes, filing_metadata)
+
+
+@pytest.mark.parametrize("count", [1, 4])
+def test_zip_directory_keeps_listing_order(filing_metadata, tmp_path, count):
+    for i in range(count):
+        csv_bytes = f"要素ID\t値\nindex\t{i}\n".encode("utf-16")
+        (tmp_path / f"S{i:03d}.zip").write_bytes(make_zip({f"{i}.csv": csv_bytes}))
+
+    filings = BaseProcessor.zip_directory_to_filings(
+        str(tmp_path), filing_metadata, max_workers=2
+    )
+    assert filings is not None
+    expected = [str(int(name[1:4])) for name in os.listdir(tmp_path)]
+    assert [filing.files[0].records[0]["値"] for filing in filings] == expected
+
+
+def test_zip_directory_without_zips(filing_metadata, tmp_path):
+    assert (
+        BaseProcessor.zip_directory_to_filings(str(tmp_path), filing_metadata) is None
+    )
@@ -0,0 +1,111 @@
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from src.cache import CONTENT_DIR_NAME, CacheManager
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> CacheManager:
+    return CacheManager(str(tmp_path / "cache"), default_ttl=60)
+
+
+def age(path: str, seconds: float) -> None:
+    """Push a file's mtime `seconds` into the past."""
+    mtime = time.time() - seconds
+    os.utime(path, (mtime, mtime))
+
+
+def content_blobs(cache: CacheManager) -> list[str]:
+    return os.listdir(cache.cache_dir / CONTENT_DIR_NAME)
+
+
+def test_json_round_trip(cache):
+    data = {"results": [{"docID": "S100", "filerName": "トヨタ自動車株式会社"}]}
+    assert cache.set_json("filings:2024-01-05:2", data)
+    assert cache.get_json("filings:2024-01-05:2") == data
+    assert cache.get_json("filings:2024-01-06:2") is None
+
+
+def test_json_expires_after_ttl(cache):
+    cache.set_json("key", {"a": 1})
+    age(cache._get_cache_path("key"), 120)
+
+    assert cache.get_json("key") is None
+    assert cache.get_json("key", ttl=300) == {"a": 1}
+
+
+def test_json_parsed_sees_on_disk_updates(cache):
+    cache.set_json("key", {"a": 1})
+    assert cache.get_json_parsed("key", dict) == {"a": 1}
+
+    # Another process rewrites the entry; the memoized value must not be served
+    path = cache._get_cache_path("key")
+    Path(path).write_text('{"a": 2}')
+    age(path, 1)
+    assert cache.get_json_parsed("key", dict) == {"a": 2}
+
+
+def test_binary_round_trip(cache):
+    assert cache.set_binary("document:S100:5", b"PK\x03\x04 zip")
+    assert cache.get_binary("document:S100:5") == b"PK\x03\x04 zip"
+    assert cache.get_binary("document:S200:5") is None
+
+
+def test_identical_binaries_share_one_content_blob(cache):
+    cache.set_binary("document:S100:5", b"same bytes")
+    cache.set_binary("document:S200:5", b"same bytes")
+    cache.set_binary("document:S300:5", b"other bytes")
+
+    first = cache._get_cache_path("document:S100:5", is_binary=True)
+    second = cache._get_cache_path("document:S200:5", is_binary=True)
+    third = cache._get_cache_path("document:S300:5", is_binary=True)
+    assert os.path.samefile(first, second)
+    assert not os.path.samefile(first, third)
+    assert len(content_blobs(cache)) == 2
+
+
+def test_rewriting_binary_keeps_link(cache):
+    cache.set_binary("document:S100:5", b"same bytes")
+    cache.set_binary("document:S100:5", b"same bytes")
+
+    assert cache.get_binary("document:S100:5") == b"same bytes"
+    assert len(content_blobs(cache)) == 1
+
+
+def test_clear_expired_removes_old_entries_and_orphaned_blobs(cache):
+    cache.set_json("old-json", {"a": 1})
+    cache.set_json("new-json", {"b": 2})
+    cache.set_binary("old-bin", b"old bytes")
+    cache.set_binary("new-bin", b"new bytes")
+    age(cache._get_cache_path("old-json"), 120)
+    age(cache._get_cache_path("old-bin", is_binary=True), 120)
+
+    assert cache.clear_expired() == 2
+    assert cache.get_json("new-json") == {"b": 2}
+    assert cache.get_binary("new-bin") == b"new bytes"
+    # The expired entry's blob is no longer linked and is removed with it
+    assert len(content_blobs(cache)) == 1
+
+
+def test_orphan_cleanup_keeps_linked_blobs(cache):
+    cache.set_binary("kept", b"kept bytes")
+    cache.set_binary("dropped", b"dropped bytes")
+    os.unlink(cache._get_cache_path("dropped", is_binary=True))
+
+    assert cache.clear_expired() == 0
+    assert cache.get_binary("kept") == b"kept bytes"
+    assert len(content_blobs(cache)) == 1
+
+
+def test_clear_all_removes_entries_and_blobs(cache):
+    cache.set_json("json", {"a": 1})
+    cache.set_binary("bin", b"bytes")
+
+    assert cache.clear_all() == 2
+    assert cache.get_json("json") is None
+    assert cache.get_binary("bin") is None
+    assert content_blobs(cache) == []
+    assert cache.get_cache_stats()["total_files"] == 0
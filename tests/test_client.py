@@ -0,0 +1,264 @@
+import asyncio
+import datetime
+import os
+import time
+
+import httpx
+import pytest
+
+from src.config import CACHE_TTL_FILINGS, CACHE_TTL_SETTLED_FILINGS
+from src.edinet.client import EdinetClient
+from src.models import EdinetConnectionError, ValidationError
+
+URL = "https://example.test/documents.json"
+
+
+class RespondInTurn:
+    """Mock transport handler answering successive requests with `responses`."""
+
+    def __init__(self, *responses: httpx.Response) -> None:
+        self.responses = responses
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        return self.responses[min(len(self.requests), len(self.responses)) - 1]
+
+
+def test_fetch_retries_server_errors(make_client, sleeps):
+    handler = RespondInTurn(
+        httpx.Response(500, text="boom"), httpx.Response(200, json={"ok": True})
+    )
+    client = make_client(handler)
+
+    assert client._fetch_with_retry(URL, {}) == {"ok": True}
+    assert len(handler.requests) == 2
+    assert len(sleeps) == 1
+
+
+def test_fetch_sends_api_key(make_client, sleeps):
+    handler = RespondInTurn(httpx.Response(200, json={}))
+    client = make_client(handler)
+
+    client._fetch_with_retry(URL, {"date": "2024-01-05"})
+    params = handler.requests[0].url.params
+    assert params["Subscription-Key"] == "test-key"
+    assert params["date"] == "2024-01-05"
+
+
+def test_fetch_retries_invalid_json(make_client, sleeps):
+    handler = RespondInTurn(
+        httpx.Response(200, text="not json"), httpx.Response(200, json=[1])
+    )
+    client = make_client(handler)
+
+    assert client._fetch_with_retry(URL, {}) == [1]
+    assert len(handler.requests) == 2
+
+
+@pytest.mark.parametrize("status", [400, 401, 403, 404])
+def test_fetch_fails_fast_on_non_retryable_status(make_client, sleeps, status):
+    handler = RespondInTurn(httpx.Response(status, text="nope"))
+    client = make_client(handler, max_retries=3)
+
+    with pytest.raises(EdinetConnectionError):
+        client._fetch_with_retry(URL, {})
+    assert len(handler.requests) == 1
+    assert sleeps == []
+
+
+def test_fetch_gives_up_after_max_retries(make_client, sleeps):
+    handler = RespondInTurn(httpx.Response(503, text="busy"))
+    client = make_client(handler, max_retries=3)
+
+    with pytest.raises(EdinetConnectionError):
+        client._fetch_with_retry(URL, {})
+    assert len(handler.requests) == 3
+    assert len(sleeps) == 2
+
+
+def test_fetch_honors_retry_after(make_client, sleeps):
+    handler = RespondInTurn(
+        httpx.Response(429, headers={"Retry-After": "7"}),
+        httpx.Response(200, json={}),
+    )
+    client = make_client(handler)
+
+    client._fetch_with_retry(URL, {})
+    # Zero base delay, so the whole wait comes from the header
+    assert sleeps[0] == 7
+    assert client._get_rate_limit_wait() > 0
+
+
+def test_fetch_ignores_retry_after_on_server_error(make_client, sleeps):
+    handler = RespondInTurn(
+        httpx.Response(500, headers={"Retry-After": "7"}),
+        httpx.Response(200, json={}),
+    )
+    client = make_client(handler)
+
+    client._fetch_with_retry(URL, {})
+    assert sleeps == [0]
+
+
+def test_afetch_retries_and_fails_fast(make_client):
+    client = make_client(RespondInTurn(httpx.Response(200, json={})))
+    handler = RespondInTurn(
+        httpx.Response(502, text="bad gateway"),
+        httpx.Response(200, json={"ok": True}),
+        httpx.Response(404, text="missing"),
+    )
+
+    async def run():
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        ) as async_client:
+            data = await client._afetch_with_retry(async_client, URL, {})
+            with pytest.raises(EdinetConnectionError):
+                await client._afetch_with_retry(async_client, URL, {})
+        return data
+
+    assert asyncio.run(run()) == {"ok": True}
+    assert len(handler.requests) == 3
+
+
+def test_stream_retries_and_leaves_no_partial_file(make_client, sleeps, tmp_path):
+    handler = RespondInTurn(
+        httpx.Response(503, text="busy"), httpx.Response(200, content=b"zip bytes")
+    )
+    client = make_client(handler)
+    target = tmp_path / "doc.zip"
+
+    client._stream_with_retry(URL, {}, str(target))
+    assert target.read_bytes() == b"zip bytes"
+    assert not (tmp_path / "doc.zip.part").exists()
+    assert len(sleeps) == 1
+
+
+def test_stream_fails_fast_on_non_retryable_status(make_client, sleeps, tmp_path):
+    handler = RespondInTurn(httpx.Response(404, text="missing"))
+    client = make_client(handler)
+    target = tmp_path / "doc.zip"
+
+    with pytest.raises(EdinetConnectionError):
+        client._stream_with_retry(URL, {}, str(target))
+    assert not target.exists()
+    assert not (tmp_path / "doc.zip.part").exists()
+    assert len(handler.requests) == 1
+
+
+def test_astream_retries_and_fails_fast(make_client, tmp_path):
+    client = make_client(RespondInTurn(httpx.Response(200, json={})))
+    handler = RespondInTurn(
+        httpx.Response(500, text="boom"),
+        httpx.Response(200, content=b"zip bytes"),
+        httpx.Response(403, text="forbidden"),
+    )
+    target = tmp_path / "doc.zip"
+    missing = tmp_path / "missing.zip"
+
+    async def run():
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        ) as async_client:
+            await client._astream_with_retry(async_client, URL, {}, str(target))
+            with pytest.raises(EdinetConnectionError):
+                await client._astream_with_retry(async_client, URL, {}, str(missing))
+
+    asyncio.run(run())
+    assert target.read_bytes() == b"zip bytes"
+    assert not missing.exists()
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["doc.zip", "downloads"]
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("2024-01-05", "2024-01-05"),
+        ("2024-1-5", "2024-01-05"),
+        ("2024-12-5", "2024-12-05"),
+        (datetime.date(2024, 1, 5), "2024-01-05"),
+        (datetime.datetime(2024, 1, 5, 9, 30), "2024-01-05"),
+    ],
+)
+def test_validate_date_normalizes(make_client, value, expected):
+    client = make_client(RespondInTurn(httpx.Response(200, json={})))
+    assert client._validate_date(value) == expected
+
+
+@pytest.mark.parametrize(
+    "value", ["2024/01/05", "2024-13-01", "2024-02-30", "2024-W01-1", "", "20240105"]
+)
+def test_validate_date_rejects_invalid(make_client, value):
+    client = make_client(RespondInTurn(httpx.Response(200, json={})))
+    with pytest.raises(ValidationError):
+        client._validate_date(value)
+
+
+def test_client_requires_positive_timeout():
+    with pytest.raises(ValueError):
+        EdinetClient(api_key="test-key", timeout=0)
+
+
+def test_download_path_sanitizes_filer_name(
+    make_client, make_filing_metadata, tmp_path
+):
+    client = make_client(RespondInTurn(httpx.Response(200, json={})))
+    filing_metadata = make_filing_metadata(filerName='A/B\\C:D*E?"F<G>H|' + "x" * 100)
+
+    path = client._get_download_path(filing_metadata, str(tmp_path))
+    assert path is not None
+    filename = os.path.basename(path)
+    assert os.path.dirname(path) == str(tmp_path)
+    assert filename.startswith("S100ABCD-160-A_B_C_D_E_F_G_H_")
+    assert len(filename) < 100
+
+
+def test_download_path_requires_metadata(make_client, make_filing_metadata, tmp_path):
+    client = make_client(RespondInTurn(httpx.Response(200, json={})))
+    filing_metadata = make_filing_metadata(filerName=None)
+
+    assert client._get_download_path(filing_metadata, str(tmp_path)) is None
+
+
+def test_clear_expired_cache_keeps_settled_filing_lists(
+    make_client, filing_metadata, tmp_path
+):
+    handler = RespondInTurn(
+        httpx.Response(
+            200,
+            json={
+                "metadata": {
+                    "title": "提出された書類を把握するためのAPI",
+                    "parameter": {"date": "2024-01-05", "type": "2"},
+                    "resultset": {"count": 1},
+                    "processDateTime": "2024-01-06 00:00",
+                    "status": "200",
+                    "message": "OK",
+                },
+                "results": [filing_metadata.model_dump()],
+            },
+        )
+    )
+    client = make_client(handler, enable_cache=True)
+    settled_date = datetime.date.today() - datetime.timedelta(days=30)
+
+    assert len(client.list_filings(settled_date)) == 1
+    # Two days old: past CACHE_TTL_FILINGS, well within CACHE_TTL_SETTLED_FILINGS
+    two_days_ago = time.time() - 2 * 24 * 60 * 60
+    for entry in (tmp_path / "cache").glob("*.json"):
+        os.utime(entry, (two_days_ago, two_days_ago))
+
+    assert client.clear_expired_cache() == {"files_removed": 0}
+    assert len(client.list_filings(settled_date)) == 1
+    assert len(handler.requests) == 1
+
+
+def test_filings_cache_ttl_for_unpadded_dates(make_client):
+    client = make_client(RespondInTurn(httpx.Response(200, json={})))
+    today = datetime.date.today()
+
+    settled = client._validate_date("2020-1-5")
+    assert client._get_filings_cache_ttl(settled) == CACHE_TTL_SETTLED_FILINGS
+    recent = client._validate_date(f"{today.year}-{today.month}-{today.day}")
+    assert client._get_filings_cache_ttl(recent) == CACHE_TTL_FILINGS